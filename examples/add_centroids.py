@@ -8,7 +8,7 @@ s = np.random.normal(mu, sigma, 1000)
 counts, bins = np.histogram(s, bins=50)
 
 viewer1d = napari_plot.Viewer()
-viewer1d.add_centroids(np.c_[bins[1::], counts])
+viewer1d.add_centroids(x=bins[1::], y=counts)
 viewer1d.add_inf_line([0], orientation="vertical", color="cyan")
 viewer1d.text_overlay.text = "Distribution"
 viewer1d.text_overlay.visible = True
@@ -19,7 +19,7 @@ viewer1d.window._qt_viewer.canvas.measure_fps(callback=update_fps)
 
 for i in range(n_lines):
     y = np.random.uniform(0, 1, size=n_pts) + i
-    viewer1d.add_line(np.c_[x, y], name=f"Line {i}")
+    viewer1d.add_line(x=x, y=y, name=f"Line {i}")
 
 if __name__ == "__main__":
     napari_plot.run()
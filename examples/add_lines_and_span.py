@@ -8,7 +8,7 @@ x = np.arange(0.0, 10.0, 0.01)
 y = np.sin(2 * np.pi * x)
 pos_x = x[np.where(y == 1.0)]
 window = 0.2
-viewer1d.add_line(np.c_[x, y], name="Sin", color="#FF0000")
+viewer1d.add_line(x=x, y=y, name="Sin", color="#FF0000")
 viewer1d.add_region(
     [(p - window, p + window) for p in pos_x],
     orientation="vertical",
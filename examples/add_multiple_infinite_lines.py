@@ -4,7 +4,7 @@ import napari_plot
 import numpy as np
 
 viewer1d = napari_plot.Viewer()
-viewer1d.add_line(np.c_[np.arange(1000), np.random.randint(0, 1000, 1000)], name="line")
+viewer1d.add_line(x=np.arange(1000), y=np.random.randint(0, 1000, 1000), name="line")
 
 # You can add infinite lines providing different orientations and colors
 layer = viewer1d.add_inf_line(
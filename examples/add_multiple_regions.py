@@ -4,7 +4,7 @@ import napari_plot
 import numpy as np
 
 viewer1d = napari_plot.Viewer()
-viewer1d.add_line(np.c_[np.arange(100), np.random.randint(0, 1000, 100)], name="line")
+viewer1d.add_line(x=np.arange(100), y=np.random.randint(0, 1000, 100), name="line")
 
 regions = [
     ([25, 50], "vertical"),
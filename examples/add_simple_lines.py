@@ -6,8 +6,8 @@ import numpy as np
 viewer1d = napari_plot.Viewer()
 viewer1d.camera.extent_mode = "restricted"
 x = np.arange(0.0, 2.0, 0.01)
-viewer1d.add_line(np.c_[x + 0.25, 1 + np.sin(2 * np.pi * x)], name="Sin", color="#FF0000")
-viewer1d.add_line(np.c_[x + 0.25, 1 + np.cos(2 * np.pi * x)], name="Cos", color="#0000FF")
+viewer1d.add_line(x=x + 0.25, y=1 + np.sin(2 * np.pi * x), name="Sin", color="#FF0000")
+viewer1d.add_line(x=x + 0.25, y=1 + np.cos(2 * np.pi * x), name="Cos", color="#0000FF")
 viewer1d.axis.x_label = "time (s)"
 viewer1d.axis.y_label = "voltage (mV)"
 if __name__ == "__main__":
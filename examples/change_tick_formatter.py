@@ -20,7 +20,7 @@ t = np.linspace(0, 2 * np.pi, 400)
 r = 0.5 + np.cos(t)
 x, y = r * np.cos(t), r * np.sin(t)
 
-viewer1d.add_line(np.c_[x, y], color="orange")
+viewer1d.add_line(x=x, y=y, color="orange")
 viewer1d.camera.x_range = (-0.25, 1.75)
 viewer1d.camera.y_range = (-1, 1)
 if __name__ == "__main__":
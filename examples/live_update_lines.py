@@ -24,8 +24,8 @@ def run_update(*_):
 viewer1d = napari_plot.Viewer()
 x = np.arange(0.0, 10.0, 0.01)
 window = 0.2
-layer_sin = viewer1d.add_line(np.c_[x, np.sin(2 * np.pi * x)], name="Sin", color="magenta")
-layer_cos = viewer1d.add_line(np.c_[x, np.cos(2 * np.pi * x)], name="Cos", color="springgreen")
+layer_sin = viewer1d.add_line(x=x, y=np.sin(2 * np.pi * x), name="Sin", color="magenta")
+layer_cos = viewer1d.add_line(x=x, y=np.cos(2 * np.pi * x), name="Cos", color="springgreen")
 run_update()
 if __name__ == "__main__":
     napari_plot.run()
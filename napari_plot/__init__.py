@@ -1,5 +1,7 @@
 """Init"""
 
+from importlib import import_module
+
 try:
     from napari_plot._version import version as __version__
 except ImportError:
@@ -8,12 +10,29 @@ except ImportError:
 # Need to import to ensure that `napari_plot` is included in the auto-class generator
 from napari_plot.utils import _register  # isort:skip noqa
 
-from napari_plot._contribution import napari_experimental_provide_dock_widget  # noqa: F401
-from napari_plot._qt.qt_event_loop import run  # noqa: F401
-from napari_plot.components.viewer_model import ViewerModel as ViewerModel1D  # noqa: F401
+# Objects that depend on Qt/vispy are imported lazily, upon first access, to keep `import napari_plot` cheap.
+# Importing `STYLES` ensures that stylesheets are included in the `STYLES` dictionary.
+_LAZY_IMPORTS = {
+    "napari_experimental_provide_dock_widget": ("napari_plot._contribution", "napari_experimental_provide_dock_widget"),
+    "run": ("napari_plot._qt.qt_event_loop", "run"),
+    "ViewerModel1D": ("napari_plot.components.viewer_model", "ViewerModel"),
+    "STYLES": ("napari_plot.resources", "STYLES"),
+    "Viewer": ("napari_plot.viewer", "Viewer"),
+}
+
+
+def __getattr__(name: str):
+    """Import objects on first access."""
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Need to import to ensure that stylesheets are included in the `STYLES` dictionary
-from napari_plot.resources import STYLES  # noqa: F401
-from napari_plot.viewer import Viewer  # noqa: F401
 
 del _register
@@ -0,0 +1,25 @@
+"""Test helpers."""
+
+import numpy as np
+import pytest
+from qtpy.QtCore import QObject
+from qtpy.QtGui import QColor, QImage
+
+from napari_plot._qt.helpers import qimage_to_array, qt_signals_blocked
+
+
+@pytest.mark.parametrize("fmt", [QImage.Format_ARGB32, QImage.Format_RGBA8888])
+def test_qimage_to_array(qapp, fmt):
+    image = QImage(5, 3, fmt)
+    image.fill(QColor(255, 128, 0, 255))
+    arr = qimage_to_array(image)
+    assert arr.shape == (3, 5, 4)
+    assert arr.dtype == np.uint8
+    np.testing.assert_array_equal(arr[0, 0], [255, 128, 0, 255])
+
+
+def test_qt_signals_blocked(qapp):
+    objs = [QObject(), QObject()]
+    with qt_signals_blocked(*objs):
+        assert all(obj.signalsBlocked() for obj in objs)
+    assert not any(obj.signalsBlocked() for obj in objs)
@@ -4,7 +4,13 @@ import pytest
 from napari.layers import Points
 from napari.layers.points._points_constants import Mode
 
-from napari_plot._qt.widgets.qt_icon_button import SIZES, QtImagePushButton, QtModePushButton, QtModeRadioButton
+from napari_plot._qt.widgets.qt_icon_button import (
+    SIZES,
+    QtImagePushButton,
+    QtModePushButton,
+    QtModeRadioButton,
+    get_qta_icon,
+)
 
 
 @pytest.mark.parametrize("size_name", SIZES)
@@ -44,3 +50,11 @@ def test_push_button(qtbot):
     btn.click()
     qtbot.wait(50)
     assert layer.test_prop
+
+
+def test_get_qta_icon(qtbot):
+    """Make sure icons are re-used between calls"""
+    icon = get_qta_icon("home")
+    assert icon is get_qta_icon("home")
+    assert icon is get_qta_icon("fa5s.home")
+    assert icon is not get_qta_icon("zoom")
@@ -1,6 +1,6 @@
 import pytest
 
-from napari_plot._qt.widgets.qt_dev import QtReload
+from napari_plot._qt.widgets.qt_dev import QtReload, path_to_module
 
 
 @pytest.fixture
@@ -23,3 +23,9 @@ class TestQtReload:
         assert widget._path is not None
         paths = widget._get_paths(widget._path)
         assert len(paths) > 0
+
+
+def test_path_to_module(tmp_path):
+    root = tmp_path / "napari_plot"
+    path = root / "_qt" / "widgets" / "qt_dev.py"
+    assert path_to_module(str(path), root.resolve()) == "napari_plot._qt.widgets.qt_dev"
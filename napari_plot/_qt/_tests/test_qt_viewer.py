@@ -18,6 +18,33 @@ def test_qt_viewer(make_napari_plot_viewer):
     assert view.layers.model().rowCount() == 0
 
 
+def test_qt_viewer_toolbar_hidden(make_napari_plot_viewer):
+    """Test that toolbar buttons are not created when the toolbar is never shown."""
+    viewer = make_napari_plot_viewer()
+    toolbar = viewer.window._qt_viewer.viewerToolbar
+    assert not toolbar._buttons_built
+    assert toolbar.layers_btn is None
+
+
+def test_qt_viewer_toolbar_shown(make_napari_plot_viewer):
+    """Test that toolbar buttons are created once, when the toolbar is shown."""
+    viewer = make_napari_plot_viewer()
+    toolbar = viewer.window._qt_viewer.viewerToolbar
+    toolbar.toolbar_right.show()
+    assert toolbar._buttons_built
+    for btn in (toolbar.tools_camera_btn, toolbar.tools_axis_btn, toolbar.tools_tool_btn, toolbar.layers_btn):
+        assert btn is not None
+    assert toolbar.tools_tool_btn.menu() is not None
+    n_items = toolbar.toolbar_right.n_items
+    layers_btn = toolbar.layers_btn
+
+    # showing the toolbar again should not add any buttons
+    toolbar.toolbar_right.hide()
+    toolbar.toolbar_right.show()
+    assert toolbar.toolbar_right.n_items == n_items
+    assert toolbar.layers_btn is layers_btn
+
+
 def test_qt_viewer_with_console(make_napari_plot_viewer):
     """Test instantiating console from viewer."""
     viewer = make_napari_plot_viewer()
@@ -64,6 +91,15 @@ def test_screenshot(make_napari_plot_viewer):
     assert screenshot.ndim == 3
 
 
+@skip_on_win_ci
+def test_screenshot_batch(make_napari_plot_viewer, tmp_path):
+    viewer = make_napari_plot_viewer()
+    viewer.add_points(20 * np.random.random((10, 2)))
+    paths = [str(tmp_path / f"screenshot_{i}.png") for i in range(3)]
+    viewer.screenshot_batch(paths)
+    assert all((tmp_path / f"screenshot_{i}.png").exists() for i in range(3))
+
+
 def test_remove_points(make_napari_plot_viewer):
     viewer = make_napari_plot_viewer()
     viewer.add_points([(1, 2), (2, 3)])
@@ -1,4 +1,17 @@
+import numpy as np
+from napari._qt.widgets.qt_viewer_dock_widget import QtViewerDockWidget
+from qtpy.QtWidgets import QWidget
+
 from napari_plot._qt.qt_main_window import _QtMainWindow
+from napari_plot.components.dragtool import DragMode
+
+
+def test_hidden_viewer_has_window(make_napari_plot_viewer):
+    """Test that hidden viewers create their window upfront, so layers added later are displayed in it."""
+    viewer = make_napari_plot_viewer(show=False)
+    assert _QtMainWindow.current() is viewer.window._qt_window
+    viewer.add_line(np.c_[np.arange(10), np.arange(10)])
+    assert len(viewer.window._qt_viewer.layer_to_visual) == 1
 
 
 def test_current_viewer(make_napari_plot_viewer, qapp):
@@ -10,28 +23,62 @@ def test_current_viewer(make_napari_plot_viewer, qapp):
 
     # when we create a new viewer it becomes accessible at Viewer.current()
     v1 = make_napari_plot_viewer(title="v1")
-    assert _QtMainWindow._instances == [v1.window._qt_window]
-    assert _QtMainWindow.current() == v1.window._qt_window
+    w1 = v1.window._qt_window
+    assert list(_QtMainWindow._instances.values()) == [w1]
+    assert _QtMainWindow.current() == w1
 
     v2 = make_napari_plot_viewer(title="v2")
-    assert _QtMainWindow._instances == [
-        v1.window._qt_window,
-        v2.window._qt_window,
-    ]
-    assert _QtMainWindow.current() == v2.window._qt_window
+    w2 = v2.window._qt_window
+    assert list(_QtMainWindow._instances.values()) == [w1, w2]
+    assert _QtMainWindow.current() == w2
 
     # Viewer.current() will always give the most recently activated viewer.
     v1.window.activate()
-    assert _QtMainWindow.current() == v1.window._qt_window
+    assert _QtMainWindow.current() == w1
     v2.window.activate()
-    assert _QtMainWindow.current() == v2.window._qt_window
+    assert _QtMainWindow.current() == w2
 
     # The list remembers the z-order of previous viewers ...
     v2.close()
-    assert _QtMainWindow.current() == v1.window._qt_window
-    assert _QtMainWindow._instances == [v1.window._qt_window]
+    assert _QtMainWindow.current() == w1
+    assert list(_QtMainWindow._instances.values()) == [w1]
 
     # and when none are left, Viewer.current() becomes None again
     v1.close()
-    assert _QtMainWindow._instances == []
+    assert list(_QtMainWindow._instances.values()) == []
     assert _QtMainWindow.current() is None
+
+
+def test_remove_dock_widget_by_inner_widget(make_napari_plot_viewer):
+    """Test that dock widgets can be looked up and removed by their inner widget."""
+    viewer = make_napari_plot_viewer()
+    window = viewer.window
+    inner = QWidget()
+    dock = QtViewerDockWidget(window._qt_viewer, inner, name="Test", area="right", close_btn=False)
+    window._add_viewer_dock_widget(dock)
+    assert window._docks_by_widget[id(inner)] is dock
+
+    window.remove_dock_widget(inner)
+    assert id(inner) not in window._docks_by_widget
+
+
+def test_interaction_menu_built_on_show(make_napari_plot_viewer):
+    """Test that the interaction menu is populated on first show and reflects the current tool."""
+    viewer = make_napari_plot_viewer()
+    window = viewer.window
+    assert window.view_tools.actions() == []
+
+    viewer.drag_tool.active = DragMode.BOX
+    window.view_tools.aboutToShow.emit()
+    assert window.view_tools.actions()
+    assert window._menu_tool_box.isChecked()
+
+
+def test_close_disconnects_viewer_events(make_napari_plot_viewer):
+    """Test that a closed window is no longer connected to the viewer events."""
+    viewer = make_napari_plot_viewer()
+    window = viewer.window
+    n_callbacks = len(viewer.events.status.callbacks)
+    window.close()
+    assert len(viewer.events.status.callbacks) == n_callbacks - 1
+    viewer.status = "closed"
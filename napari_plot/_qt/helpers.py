@@ -3,8 +3,9 @@
 import typing as ty
 from contextlib import contextmanager
 
+import numpy as np
 from qtpy.QtCore import Qt
-from qtpy.QtGui import QFont
+from qtpy.QtGui import QFont, QImage
 from qtpy.QtWidgets import (
     QActionGroup,
     QApplication,
@@ -323,11 +324,15 @@ def make_menu_group(parent: QWidget, *actions):
 
 
 @contextmanager
-def qt_signals_blocked(obj):
-    """Context manager to temporarily block signals from `obj`"""
-    obj.blockSignals(True)
-    yield
-    obj.blockSignals(False)
+def qt_signals_blocked(*objs):
+    """Context manager to temporarily block signals from one or more objects."""
+    for obj in objs:
+        obj.blockSignals(True)
+    try:
+        yield
+    finally:
+        for obj in objs:
+            obj.blockSignals(False)
 
 
 def get_parent(parent):
@@ -340,3 +345,17 @@ def get_parent(parent):
                     parent = i
                     break
     return parent
+
+
+def qimage_to_array(image: QImage) -> np.ndarray:
+    """Convert QImage to array of type ubyte and shape (h, w, 4) with RGBA channel order."""
+    # with RGBA8888 the bytes are already in the right order so no per-channel reordering is required
+    if image.format() != QImage.Format_RGBA8888:
+        image = image.convertToFormat(QImage.Format_RGBA8888)
+    h, w = image.height(), image.width()
+    bits = image.constBits()
+    if hasattr(bits, "setsize"):  # PyQt returns `sip.voidptr` without size
+        bits.setsize(image.bytesPerLine() * h)
+    arr = np.frombuffer(bits, dtype=np.uint8).reshape(h, image.bytesPerLine() // 4, 4)[:, :w]
+    # copy as the memory is owned by the QImage
+    return arr.copy()
@@ -17,6 +17,7 @@ from qtpy.QtGui import QIcon
 from qtpy.QtWidgets import QApplication
 
 from napari_plot import __version__
+from napari_plot.resources import clear_stylesheet_cache
 
 NAPARI_PLOT_ICON_PATH = os.path.join(os.path.dirname(__file__), "..", "resources", "logo.png")
 NAPARI_APP_ID = f"napari_plot.napari_plot.viewer.{__version__}"
@@ -147,6 +148,8 @@ def get_app(
             # can be used in qss files and elsewhere.
             plugin_manager.discover_icons()
             plugin_manager.discover_qss()
+            # plugins may have registered new styles
+            clear_stylesheet_cache()
         except AttributeError:
             pass
 
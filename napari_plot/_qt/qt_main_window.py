@@ -1,16 +1,18 @@
 """Native window."""
 
-import time
+import os
 import typing as ty
+from collections import OrderedDict
+from contextlib import contextmanager, suppress
 from functools import partial
 from weakref import WeakValueDictionary
 
 from napari._qt.dialogs.screenshot_dialog import ScreenshotDialog
 from napari._qt.qt_main_window import _QtMainWindow as Napari_QtMainWindow
-from napari._qt.utils import QImg2array
+from napari._qt.utils import add_flash_animation
 from napari._qt.widgets.qt_viewer_dock_widget import QtViewerDockWidget
-from qtpy.QtCore import QEvent, QEventLoop, Qt
-from qtpy.QtGui import QIcon, QKeySequence
+from qtpy.QtCore import QEvent, QEventLoop, Qt, QTimer, Signal
+from qtpy.QtGui import QGuiApplication, QIcon, QKeySequence
 from qtpy.QtWidgets import (
     QAction,
     QApplication,
@@ -28,7 +30,13 @@ from napari_plot._qt.qt_event_loop import NAPARI_PLOT_ICON_PATH, get_app, quit_a
 from napari_plot._qt.qt_viewer import QtViewer
 from napari_plot.components.camera import CameraMode, ExtentMode
 from napari_plot.components.dragtool import DragMode
-from napari_plot.resources import get_stylesheet
+from napari_plot.resources import get_cached_stylesheet
+
+# Canvas background and axis label colors for each of the background options in the `View` menu
+_BACKGROUNDS = {"dark": ("black", "white"), "light": ("white", "black")}
+
+# Events that move a window to the top of the `_QtMainWindow._instances` stack
+_RAISE_EVENTS = frozenset({QEvent.WindowActivate, QEvent.ZOrderChange})
 
 
 class _QtMainWindow(QMainWindow):
@@ -42,8 +50,12 @@ class _QtMainWindow(QMainWindow):
     # To track window instances and facilitate getting the "active" viewer...
     # We use this instead of QApplication.activeWindow for compatibility with
     # IPython usage. When you activate IPython, it will appear that there are
-    # *no* active windows, so we want to track the most recently active windows
-    _instances: ty.ClassVar[ty.List["_QtMainWindow"]] = []
+    # *no* active windows, so we want to track the most recently active windows. Windows are keyed by their `id` so
+    # they can be moved to the end (most recent) in constant time.
+    _instances: ty.ClassVar["OrderedDict[int, _QtMainWindow]"] = OrderedDict()
+
+    # emitted when the window becomes visible again after being hidden or minimized
+    restored = Signal()
 
     def __init__(self, viewer: QtViewer, parent=None) -> None:
         super().__init__(parent)
@@ -69,31 +81,38 @@ class _QtMainWindow(QMainWindow):
         self.setCentralWidget(center)
         self.setWindowTitle(self._qt_viewer.viewer.title)
         # Keep track of current instance
-        _QtMainWindow._instances.append(self)
+        _QtMainWindow._instances[id(self)] = self
 
         # This is required for notifications to work properly
         Napari_QtMainWindow._instances.append(self)
 
     @classmethod
     def current(cls):
-        return cls._instances[-1] if cls._instances else None
+        return next(reversed(cls._instances.values()), None)
 
     def event(self, e):
-        if e.type() == QEvent.Close:
+        # this is called for every event delivered to the window so keep the common path short
+        event_type = e.type()
+        if event_type == QEvent.Close:
             # when we close the MainWindow, remove it from the instances list
-            try:
-                _QtMainWindow._instances.remove(self)
-            except ValueError:
-                pass
-        if e.type() in {QEvent.WindowActivate, QEvent.ZOrderChange}:
+            _QtMainWindow._instances.pop(id(self), None)
+        elif event_type in _RAISE_EVENTS:
             # upon activation or raise_, put window at the end of _instances
             try:
-                inst = _QtMainWindow._instances
-                inst.append(inst.pop(inst.index(self)))
-            except ValueError:
+                _QtMainWindow._instances.move_to_end(id(self))
+            except KeyError:
                 pass
         return super().event(e)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.restored.emit()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self.restored.emit()
+
     # noinspection PyShadowingNames
     def close(self, quit_app=False):
         """Override to handle closing app or just the window."""
@@ -102,20 +121,13 @@ class _QtMainWindow(QMainWindow):
 
     def close_window(self):
         """Close active dialog or active window."""
-        parent = QApplication.focusWidget()
-        while parent is not None:
-            if isinstance(parent, QMainWindow):
-                self.close()
-                break
-
-            if isinstance(parent, QDialog):
-                parent.close()
-                break
-
-            try:
-                parent = parent.parent()
-            except Exception:
-                parent = getattr(parent, "_parent", None)
+        widget = QApplication.focusWidget()
+        top = widget.window() if widget is not None else None
+        # floating dock widgets are their own top-level window, but closing them should close the main window
+        if isinstance(top, (QMainWindow, QDockWidget)):
+            self.close()
+        elif isinstance(top, QDialog):
+            top.close()
 
     def show(self, block=False):
         super().show()
@@ -135,10 +147,22 @@ class _QtMainWindow(QMainWindow):
         # some bug deep in NSWindow.  This forces the fullscreen keybinding
         # test to complete its draw cycle, then pop back out of fullscreen.
         if self.isFullScreen():
+            # wait until the native window reports leaving fullscreen, for at most 500 ms, rather than always
+            # blocking for the full time. `isFullScreen` is already False after `showNormal` so it can't be used here.
+            loop = QEventLoop()
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(loop.quit)
+            handle = self.windowHandle()
+            if handle is not None:
+                handle.windowStateChanged.connect(loop.quit)
             self.showNormal()
-            for _i in range(5):
-                time.sleep(0.1)
-                QApplication.processEvents()
+            timer.start(500)
+            loop.exec_()
+            timer.stop()
+            if handle is not None:
+                handle.windowStateChanged.disconnect(loop.quit)
+            QApplication.processEvents()
 
         if self._quit_app:
             quit_app()
@@ -178,6 +202,10 @@ class Window:
         # Dictionary holding dock widgets
         self._dock_widgets: ty.Dict[str, QtViewerDockWidget] = WeakValueDictionary()
         self._unnamed_dockwidget_count = 1
+        # Dock widgets added to the main window, keyed by `id` of their inner widget
+        self._docks_by_widget: ty.Dict[int, QDockWidget] = {}
+        # Pending `resizeDocks` calls while dock widgets are added in a batch
+        self._pending_dock_resizes: ty.Optional[ty.Dict[int, ty.List[QDockWidget]]] = None
 
         # Connect the Viewer and create the Main Window
         self._qt_window = _QtMainWindow(viewer)
@@ -197,16 +225,25 @@ class Window:
         # Setup development tools
         self._setup_dev_tools()
 
-        if hasattr(self._qt_viewer, "dockConsole"):
-            self._add_viewer_dock_widget(self._qt_viewer.dockConsole, tabify=False, menu=self.window_menu)
-        self._add_viewer_dock_widget(self._qt_viewer.dockLayerControls, tabify=False, menu=self.window_menu)
-        self._add_viewer_dock_widget(self._qt_viewer.dockLayerList, tabify=False, menu=self.window_menu)
-        if hasattr(self._qt_viewer, "dockCamera"):
-            self._add_viewer_dock_widget(self._qt_viewer.dockCamera, tabify=False, menu=self.window_menu)
-        if hasattr(self._qt_viewer, "dockAxis"):
-            self._add_viewer_dock_widget(self._qt_viewer.dockAxis, tabify=False, menu=self.window_menu)
+        with self._batch_dock_widgets():
+            if hasattr(self._qt_viewer, "dockConsole"):
+                self._add_viewer_dock_widget(self._qt_viewer.dockConsole, tabify=False, menu=self.window_menu)
+            self._add_viewer_dock_widget(self._qt_viewer.dockLayerControls, tabify=False, menu=self.window_menu)
+            self._add_viewer_dock_widget(self._qt_viewer.dockLayerList, tabify=False, menu=self.window_menu)
+            if hasattr(self._qt_viewer, "dockCamera"):
+                self._add_viewer_dock_widget(self._qt_viewer.dockCamera, tabify=False, menu=self.window_menu)
+            if hasattr(self._qt_viewer, "dockAxis"):
+                self._add_viewer_dock_widget(self._qt_viewer.dockAxis, tabify=False, menu=self.window_menu)
 
         self._status_bar.showMessage("Ready")
+        # status and help messages are coalesced so that only the latest ones are shown once per event-loop pass
+        self._pending_status: ty.Optional[str] = None
+        self._pending_help: ty.Optional[str] = None
+        self._status_timer = QTimer(self._qt_window)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(0)
+        self._status_timer.timeout.connect(self._flush_status_bar)
+        self._qt_window.restored.connect(self._flush_status_bar)
         self._help = QLabel("")
         self._status_bar.addPermanentWidget(self._help)
 
@@ -220,14 +257,15 @@ class Window:
 
     def _setup_dev_tools(self):
         """Setup development tools."""
-        import os
+        # the environment variable is read on each call since `napari_plot --dev` sets it at runtime
+        if self._dev is not None or os.getenv("NAPARI_PLOT_DEV_MODE", "0") != "1":
+            return
 
         try:
-            if os.getenv("NAPARI_PLOT_DEV_MODE", "0") and self._dev is None:
-                from napari_plot._qt.widgets.qt_dev import QtReload
+            from napari_plot._qt.widgets.qt_dev import QtReload
 
-                self._dev = QtReload()
-                print("Installed development tools.")
+            self._dev = QtReload()
+            print("Installed development tools.")
         except Exception as e:  # noqa
             print(f"Failed to install development tools. Error={e}")
 
@@ -251,10 +289,11 @@ class Window:
         # Find if any othe dock widgets are currently in area
         current_dws_in_area = [
             dw
-            for dw in self._qt_window.findChildren(QDockWidget)
+            for dw in self._docks_by_widget.values()
             if self._qt_window.dockWidgetArea(dw) == dock_widget.qt_area
         ]
         self._qt_window.addDockWidget(dock_widget.qt_area, dock_widget)
+        self._docks_by_widget[id(dock_widget.widget())] = dock_widget
 
         # If another dock widget present in area then tabify
         if current_dws_in_area:
@@ -264,9 +303,11 @@ class Window:
                 dock_widget.raise_()
             elif dock_widget.area in ("right", "left"):
                 _wdg = current_dws_in_area + [dock_widget]
-                # add sizes to push lower widgets up
-                sizes = list(range(1, len(_wdg) * 4, 4))
-                self._qt_window.resizeDocks(_wdg, sizes, Qt.Vertical)
+                if self._pending_dock_resizes is not None:
+                    # only the last resize in each area matters so defer it until the batch is finished
+                    self._pending_dock_resizes[dock_widget.qt_area] = _wdg
+                else:
+                    self._resize_docks(_wdg)
 
         if menu:
             action = dock_widget.toggleViewAction()
@@ -274,13 +315,31 @@ class Window:
             action.setText(dock_widget.name)
             menu.addAction(action)
 
+    def _resize_docks(self, dock_widgets: ty.List[QDockWidget]):
+        """Resize vertically stacked dock widgets."""
+        # add sizes to push lower widgets up
+        sizes = list(range(1, len(dock_widgets) * 4, 4))
+        self._qt_window.resizeDocks(dock_widgets, sizes, Qt.Vertical)
+
+    @contextmanager
+    def _batch_dock_widgets(self):
+        """Add several dock widgets with a single relayout of the main window."""
+        self._qt_window.setUpdatesEnabled(False)
+        self._pending_dock_resizes = {}
+        try:
+            yield
+        finally:
+            pending, self._pending_dock_resizes = self._pending_dock_resizes, None
+            for dock_widgets in pending.values():
+                self._resize_docks(dock_widgets)
+            self._qt_window.setUpdatesEnabled(True)
+
     def _remove_dock_widget(self, event=None):
-        names = list(self._dock_widgets.keys())
-        for widget_name in names:
-            if event.value in widget_name:
-                # remove this widget
-                widget = self._dock_widgets[widget_name]
-                self.remove_dock_widget(widget)
+        source = event.value
+        # collect matches first since removing widgets mutates the dictionary
+        widgets = [widget for widget_name, widget in self._dock_widgets.items() if source in widget_name]
+        for widget in widgets:
+            self.remove_dock_widget(widget)
 
     def remove_dock_widget(self, widget: QWidget, menu=None):
         """Removes specified dock widget.
@@ -300,16 +359,14 @@ class Window:
             return
 
         if not isinstance(widget, QDockWidget):
-            for dw in self._qt_window.findChildren(QDockWidget):
-                if dw.widget() is widget:
-                    _dw: QDockWidget = dw
-                    break
-            else:
+            _dw: QDockWidget = self._docks_by_widget.pop(id(widget), None)
+            if _dw is None:
                 raise LookupError(
-                    "Could not find a dock widget containing: {widget}",
+                    f"Could not find a dock widget containing: {widget}",
                 )
         else:
             _dw = widget
+            self._docks_by_widget.pop(id(_dw.widget()), None)
 
         if _dw.widget():
             _dw.widget().setParent(None)
@@ -414,57 +471,67 @@ class Window:
         self.view_menu.addAction(toggle_light)
 
     def _add_interaction_menu(self):
-        """Add 'View' menu to app menubar."""
-        # add DragMode
+        """Add 'Interaction' menu to app menubar.
+
+        The menu has no keyboard shortcuts, so its actions are only created when the menu is first shown.
+        """
         self.view_tools = self.main_menu.addMenu("&Interaction")
+        self._interaction_menu_built = False
+        self.view_tools.aboutToShow.connect(self._build_interaction_menu)
+
+    def _build_interaction_menu(self):
+        """Populate the 'Interaction' menu."""
+        if self._interaction_menu_built:
+            return
+        self._interaction_menu_built = True
+
+        # add DragMode
         self._menu_tool_auto = QAction("Tool: Auto (zoom)", self._qt_window)
         self._menu_tool_auto.setCheckable(True)
         self._menu_tool_auto.setChecked(True)
-        self._menu_tool_auto.triggered.connect(
-            lambda: setattr(self._qt_viewer.viewer.drag_tool, "active", DragMode.AUTO)
-        )
+        self._menu_tool_auto.triggered.connect(partial(self._set_drag_mode, which=DragMode.AUTO))
         self.view_tools.addAction(self._menu_tool_auto)
 
         self._menu_tool_box = QAction("Tool: Box (zoom)", self._qt_window)
         self._menu_tool_box.setCheckable(True)
-        self._menu_tool_box.triggered.connect(lambda: setattr(self._qt_viewer.viewer.drag_tool, "active", DragMode.BOX))
+        self._menu_tool_box.triggered.connect(partial(self._set_drag_mode, which=DragMode.BOX))
         self.view_tools.addAction(self._menu_tool_box)
 
         self._menu_tool_h_span = QAction("Tool: Horizontal span (zoom)", self._qt_window)
         self._menu_tool_h_span.setCheckable(True)
-        self._menu_tool_h_span.triggered.connect(
-            lambda: setattr(self._qt_viewer.viewer.drag_tool, "active", DragMode.HORIZONTAL_SPAN)
-        )
+        self._menu_tool_h_span.triggered.connect(partial(self._set_drag_mode, which=DragMode.HORIZONTAL_SPAN))
         self.view_tools.addAction(self._menu_tool_h_span)
 
         self._menu_tool_v_span = QAction("Tool: Vertical span (zoom)", self._qt_window)
         self._menu_tool_v_span.setCheckable(True)
-        self._menu_tool_v_span.triggered.connect(
-            lambda: setattr(self._qt_viewer.viewer.drag_tool, "active", DragMode.VERTICAL_SPAN)
-        )
+        self._menu_tool_v_span.triggered.connect(partial(self._set_drag_mode, which=DragMode.VERTICAL_SPAN))
         self.view_tools.addAction(self._menu_tool_v_span)
 
         self._menu_tool_box_select = QAction("Tool: Box (select)", self._qt_window)
         self._menu_tool_box_select.setCheckable(True)
-        self._menu_tool_box_select.triggered.connect(
-            lambda: setattr(self._qt_viewer.viewer.drag_tool, "active", DragMode.BOX_SELECT)
-        )
+        self._menu_tool_box_select.triggered.connect(partial(self._set_drag_mode, which=DragMode.BOX_SELECT))
         self.view_tools.addAction(self._menu_tool_box_select)
 
         self._menu_tool_polygon = QAction("Tool: Polygon (select)", self._qt_window)
         self._menu_tool_polygon.setCheckable(True)
-        self._menu_tool_polygon.triggered.connect(
-            lambda: setattr(self._qt_viewer.viewer.drag_tool, "active", DragMode.POLYGON)
-        )
+        self._menu_tool_polygon.triggered.connect(partial(self._set_drag_mode, which=DragMode.POLYGON))
         self.view_tools.addAction(self._menu_tool_polygon)
 
         self._menu_tool_lasso = QAction("Tool: Lasso (select)", self._qt_window)
         self._menu_tool_lasso.setCheckable(True)
-        self._menu_tool_lasso.triggered.connect(
-            lambda: setattr(self._qt_viewer.viewer.drag_tool, "active", DragMode.LASSO)
-        )
+        self._menu_tool_lasso.triggered.connect(partial(self._set_drag_mode, which=DragMode.LASSO))
         self.view_tools.addAction(self._menu_tool_lasso)
 
+        self._menu_tools = {
+            DragMode.AUTO: self._menu_tool_auto,
+            DragMode.BOX: self._menu_tool_box,
+            DragMode.HORIZONTAL_SPAN: self._menu_tool_h_span,
+            DragMode.VERTICAL_SPAN: self._menu_tool_v_span,
+            DragMode.BOX_SELECT: self._menu_tool_box_select,
+            DragMode.POLYGON: self._menu_tool_polygon,
+            DragMode.LASSO: self._menu_tool_lasso,
+        }
+
         # ensures that only single tool can be selected at at ime
         hp.make_menu_group(
             self._qt_window,
@@ -508,24 +575,27 @@ class Window:
         self._menu_extent_unrestricted = QAction("Extent mode: Unrestricted", self._qt_window)
         self._menu_extent_unrestricted.setCheckable(True)
         self._menu_extent_unrestricted.setChecked(True)
-        self._menu_extent_unrestricted.triggered.connect(
-            lambda: setattr(self._qt_viewer.viewer.camera, "extent_mode", ExtentMode.UNRESTRICTED)
-        )
+        self._menu_extent_unrestricted.triggered.connect(partial(self._set_extent_mode, which=ExtentMode.UNRESTRICTED))
         self.view_tools.addAction(self._menu_extent_unrestricted)
 
         self._menu_extent_restricted = QAction("Extent mode: Restricted", self._qt_window)
         self._menu_extent_restricted.setCheckable(True)
-        self._menu_extent_restricted.triggered.connect(
-            lambda: setattr(self._qt_viewer.viewer.camera, "extent_mode", ExtentMode.RESTRICTED)
-        )
+        self._menu_extent_restricted.triggered.connect(partial(self._set_extent_mode, which=ExtentMode.RESTRICTED))
         self.view_tools.addAction(self._menu_extent_restricted)
 
         # ensures that only single tool can be selected at at ime
         hp.make_menu_group(self._qt_window, self._menu_extent_unrestricted, self._menu_extent_restricted)
+        # extent mode last applied to the menu, `None` until the first change
+        self._extent_state = None
 
         self._qt_viewer.viewer.drag_tool.events.active.connect(self._on_tool_change)
         self._qt_viewer.viewer.camera.events.extent_mode.connect(self._on_extent_change)
         self._qt_viewer.viewer.camera.events.axis_mode.connect(self._on_axis_mode_change)
+        # sync with any changes that happened before the menu was built
+        self._on_tool_change()
+        self._on_axis_mode_change()
+        if self._qt_viewer.viewer.camera.extent_mode != ExtentMode.UNRESTRICTED:
+            self._on_extent_change()
 
     def _add_window_menu(self):
         """Add 'Window' menu to app menubar."""
@@ -543,6 +613,14 @@ class Window:
     #     )
     #     self.help_menu.addAction(about_action)
 
+    def _set_drag_mode(self, which: DragMode):
+        """Set the active drag tool."""
+        self._qt_viewer.viewer.drag_tool.active = which
+
+    def _set_extent_mode(self, which: ExtentMode):
+        """Set the camera extent mode."""
+        self._qt_viewer.viewer.camera.extent_mode = which
+
     def _set_camera_mode(self, which: CameraMode):
         """Set camera mode.
 
@@ -556,81 +634,55 @@ class Window:
         """
         if which == CameraMode.ALL:
             self._qt_viewer.viewer.camera.axis_mode = (CameraMode.ALL,)
-            for wdg in [
-                self._menu_camera_top,
-                self._menu_camera_bottom,
-                self._menu_camera_left,
-                self._menu_camera_right,
-            ]:
-                with hp.qt_signals_blocked(wdg):
-                    wdg.setChecked(False)
+            self._set_camera_lock_checked(())
         else:
-            camera_modes = []
-            if self._menu_camera_top.isChecked():
-                camera_modes.append(CameraMode.LOCK_TO_TOP)
-            if self._menu_camera_bottom.isChecked():
-                camera_modes.append(CameraMode.LOCK_TO_BOTTOM)
-            if self._menu_camera_left.isChecked():
-                camera_modes.append(CameraMode.LOCK_TO_LEFT)
-            if self._menu_camera_right.isChecked():
-                camera_modes.append(CameraMode.LOCK_TO_RIGHT)
-            self._qt_viewer.viewer.camera.axis_mode = tuple(camera_modes)
+            self._qt_viewer.viewer.camera.axis_mode = tuple(
+                mode for wdg, mode in self._camera_lock_actions() if wdg.isChecked()
+            )
+
+    def _camera_lock_actions(self) -> ty.Tuple[ty.Tuple[QAction, CameraMode], ...]:
+        """Return camera lock menu actions together with the mode they represent."""
+        return (
+            (self._menu_camera_top, CameraMode.LOCK_TO_TOP),
+            (self._menu_camera_bottom, CameraMode.LOCK_TO_BOTTOM),
+            (self._menu_camera_left, CameraMode.LOCK_TO_LEFT),
+            (self._menu_camera_right, CameraMode.LOCK_TO_RIGHT),
+        )
+
+    def _set_camera_lock_checked(self, modes):
+        """Check camera lock menu actions that are in `modes` without emitting signals."""
+        actions = self._camera_lock_actions()
+        with hp.qt_signals_blocked(*(wdg for wdg, _ in actions)):
+            for wdg, mode in actions:
+                wdg.setChecked(mode in modes)
 
     def _on_extent_change(self, event=None):
         """Update menu appropriately."""
         state = self._qt_viewer.viewer.camera.extent_mode
+        if state == self._extent_state:
+            return
+        self._extent_state = state
         if state == ExtentMode.RESTRICTED:
             self._menu_extent_restricted.setChecked(True)
         else:
             self._menu_extent_unrestricted.setChecked(True)
-        for wdg in [
-            self._menu_camera_all,
-            self._menu_camera_top,
-            self._menu_camera_bottom,
-            self._menu_camera_left,
-            self._menu_camera_right,
-        ]:
-            wdg.setDisabled(state == ExtentMode.UNRESTRICTED)
+        disabled = state == ExtentMode.UNRESTRICTED
+        self._menu_camera_all.setDisabled(disabled)
+        for wdg, _ in self._camera_lock_actions():
+            wdg.setDisabled(disabled)
 
     def _on_tool_change(self, event=None):
         """Update menu appropriately."""
         state = self._qt_viewer.viewer.drag_tool.active
-        if state == DragMode.AUTO:
-            self._menu_tool_auto.setChecked(True)
-        elif state == DragMode.BOX:
-            self._menu_tool_box.setChecked(True)
-        elif state == DragMode.VERTICAL_SPAN:
-            self._menu_tool_v_span.setChecked(True)
-        elif state == DragMode.LASSO:
-            self._menu_tool_lasso.setChecked(True)
-        elif state == DragMode.BOX_SELECT:
-            self._menu_tool_box_select.setChecked(True)
-        elif state == DragMode.POLYGON:
-            self._menu_tool_polygon.setChecked(True)
-        else:
-            self._menu_tool_h_span.setChecked(True)
+        wdg = self._menu_tools.get(state, self._menu_tool_h_span)
+        # signals are not blocked since the action group relies on them to uncheck the other tools
+        if not wdg.isChecked():
+            wdg.setChecked(True)
 
     def _on_axis_mode_change(self, event=None):
         """Update camera menu."""
         state = self._qt_viewer.viewer.camera.axis_mode
-        if CameraMode.ALL in state:
-            for wdg in [
-                self._menu_camera_top,
-                self._menu_camera_bottom,
-                self._menu_camera_left,
-                self._menu_camera_right,
-            ]:
-                with hp.qt_signals_blocked(wdg):
-                    wdg.setChecked(False)
-        else:
-            with hp.qt_signals_blocked(self._menu_camera_top):
-                self._menu_camera_top.setChecked(CameraMode.LOCK_TO_TOP in state)
-            with hp.qt_signals_blocked(self._menu_camera_left):
-                self._menu_camera_left.setChecked(CameraMode.LOCK_TO_LEFT in state)
-            with hp.qt_signals_blocked(self._menu_camera_right):
-                self._menu_camera_right.setChecked(CameraMode.LOCK_TO_RIGHT in state)
-            with hp.qt_signals_blocked(self._menu_camera_bottom):
-                self._menu_camera_bottom.setChecked(CameraMode.LOCK_TO_BOTTOM in state)
+        self._set_camera_lock_checked(() if CameraMode.ALL in state else state)
 
     def _toggle_menubar_visible(self):
         """Toggle visibility of app menubar.
@@ -648,10 +700,7 @@ class Window:
 
     def _toggle_background(self, which: str):
         """Toggle between dark and light backgrounds."""
-        if which == "dark":
-            background, labels = "black", "white"
-        else:
-            background, labels = "white", "black"
+        background, labels = _BACKGROUNDS.get(which, _BACKGROUNDS["light"])
         self._qt_viewer.canvas.bgcolor = background
         self._qt_viewer.viewer.axis.label_color = labels
         self._qt_viewer.viewer.axis.tick_color = labels
@@ -672,7 +721,10 @@ class Window:
             else:
                 value = self._qt_viewer.viewer.theme
 
-            self._qt_window.setStyleSheet(get_stylesheet(value))
+            stylesheet = get_cached_stylesheet(value)
+            # re-applying the same stylesheet would still repolish every child widget
+            if stylesheet != self._qt_window.styleSheet():
+                self._qt_window.setStyleSheet(stylesheet)
         except (AttributeError, RuntimeError):  # wrapped C/C++ object may have been deleted
             pass
 
@@ -684,7 +736,26 @@ class Window:
         event : napari.utils.event.Event
             The napari event that triggered this method.
         """
-        self._status_bar.showMessage(event.value)
+        self._pending_status = event.value
+        self._schedule_status_bar_update()
+
+    def _schedule_status_bar_update(self):
+        """Schedule update of the status bar on the next pass of the event loop."""
+        # nobody can see the status bar of a hidden window so only show the latest message once it's restored
+        if not self._qt_window.isVisible() or self._qt_window.isMinimized():
+            return
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status_bar(self):
+        """Show the most recent status and help messages, dropping any superseded ones."""
+        status, self._pending_status = self._pending_status, None
+        # showing a message triggers a relayout of the status bar so skip it if nothing changed
+        if status is not None and status != self._status_bar.currentMessage():
+            self._status_bar.showMessage(status)
+        help_text, self._pending_help = self._pending_help, None
+        if help_text is not None and help_text != self._help.text():
+            self._help.setText(help_text)
 
     def _title_changed(self, event):
         """Update window title.
@@ -704,17 +775,39 @@ class Window:
         event : napari.utils.event.Event
             The napari event that triggered this method.
         """
-        self._help.setText(event.value)
+        self._pending_help = event.value
+        self._schedule_status_bar_update()
 
     def close(self):
         """Close the viewer window and cleanup sub-widgets."""
         # Someone is closing us twice? Only try to delete self._qt_window
         # if we still have one.
         if hasattr(self, "_qt_window"):
+            self._disconnect_events()
             self._qt_viewer.close()
             self._qt_window.close()
             del self._qt_window
 
+    def _disconnect_events(self):
+        """Disconnect from viewer events so that a closed window no longer receives them."""
+        viewer = self._qt_viewer.viewer
+        connections = [
+            (viewer.events.status, self._status_changed),
+            (viewer.events.help, self._help_changed),
+            (viewer.events.title, self._title_changed),
+            (viewer.events.theme, self._update_theme),
+        ]
+        if self._interaction_menu_built:
+            connections += [
+                (viewer.drag_tool.events.active, self._on_tool_change),
+                (viewer.camera.events.extent_mode, self._on_extent_change),
+                (viewer.camera.events.axis_mode, self._on_axis_mode_change),
+            ]
+        for emitter, callback in connections:
+            with suppress(AttributeError, ValueError):
+                emitter.disconnect(callback)
+        self._status_timer.stop()
+
     def resize(self, width, height):
         """Resize the window.
 
@@ -774,8 +867,6 @@ class Window:
             If True, screenshot shows only the image display canvas, and if False include the napari viewer frame in
              the screenshot, By default, True.
         """
-        from napari._qt.utils import add_flash_animation
-
         if canvas_only:
             img = self._qt_viewer.canvas.native.grabFramebuffer()
             if flash:
@@ -808,7 +899,13 @@ class Window:
         """
         from napari.utils.io import imsave
 
-        img = QImg2array(self._screenshot(flash, canvas_only))
+        if canvas_only:
+            # render the scene straight to an array rather than going through QImage
+            img = self._qt_viewer.canvas.render()
+            if flash:
+                add_flash_animation(self._qt_viewer._canvas_overlay)
+        else:
+            img = hp.qimage_to_array(self._screenshot(flash, canvas_only))
         if path is not None:
             imsave(path, img)  # scikit-image imsave method
         return img
@@ -822,8 +919,6 @@ class Window:
             Flag to indicate whether flash animation should be shown after
             the screenshot was captured.
         """
-        from qtpy.QtGui import QGuiApplication
-
         img = self._screenshot(flash)
         cb = QGuiApplication.clipboard()
         cb.setImage(img)
@@ -2,7 +2,7 @@
 
 from weakref import ref
 
-from qtpy.QtCore import Qt
+from qtpy.QtCore import QEvent, Qt
 from qtpy.QtWidgets import QAction, QMenu, QWidget
 
 import napari_plot._qt.helpers as hp
@@ -15,14 +15,39 @@ class QtViewToolbar(QWidget):
     # dialogs
     _dlg_axis = None
 
+    # buttons, created when the toolbar is shown for the first time
+    _buttons_built = False
+    tools_erase_btn = None
+    tools_zoomout_btn = None
+    tools_clip_btn = None
+    tools_camera_btn = None
+    tools_axis_btn = None
+    tools_text_btn = None
+    tools_grid_btn = None
+    tools_tool_btn = None
+    layers_btn = None
+
     def __init__(self, viewer, qt_viewer, **kwargs):
         super().__init__(parent=qt_viewer)
         self.viewer = viewer
         self._ref_qt_viewer = ref(qt_viewer)
 
         # create instance
-        toolbar_right = QtMiniToolbar(qt_viewer, Qt.Vertical)
-        self.toolbar_right = toolbar_right
+        self.toolbar_right = QtMiniToolbar(qt_viewer, Qt.Vertical)
+        # the toolbar is hidden in some configurations (e.g. the standalone window) so buttons are only created once
+        # it's actually shown
+        self.toolbar_right.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """Create buttons the first time the toolbar is shown."""
+        if not self._buttons_built and obj is self.toolbar_right and event.type() == QEvent.Show:
+            self._build_buttons()
+        return super().eventFilter(obj, event)
+
+    def _build_buttons(self):
+        """Create toolbar buttons."""
+        self._buttons_built = True
+        toolbar_right = self.toolbar_right
         # view reset/clear
         self.tools_erase_btn = toolbar_right.insert_qta_tool("erase", tooltip="Clear image", func=self._clear_canvas)
         self.tools_zoomout_btn = toolbar_right.insert_qta_tool("zoom_out", tooltip="Zoom-out", func=self._reset_view)
@@ -81,12 +106,17 @@ class QtViewToolbar(QWidget):
     def _toggle_axis_controls(self, _):
         from napari_plot._qt.component_controls.qt_axis_controls import QtAxisControls
 
+        # the button is used as the anchor of the dialog so make sure it exists
+        if not self._buttons_built:
+            self._build_buttons()
         dlg = QtAxisControls(self.viewer, self._ref_qt_viewer())
         dlg.show_left_of_widget(self.tools_axis_btn, x_offset=dlg.width() * 2)
 
     def _toggle_camera_controls(self, _):
         from napari_plot._qt.component_controls.qt_camera_controls import QtCameraControls
 
+        if not self._buttons_built:
+            self._build_buttons()
         dlg = QtCameraControls(self.viewer, self._ref_qt_viewer())
         dlg.show_left_of_widget(self.tools_camera_btn, x_offset=dlg.width() * 2)
 
@@ -7,7 +7,7 @@ from weakref import WeakSet
 import numpy as np
 from napari._qt.containers import QtLayerList
 from napari._qt.dialogs.screenshot_dialog import ScreenshotDialog
-from napari._qt.utils import QImg2array, add_flash_animation, circle_pixmap, crosshair_pixmap, square_pixmap
+from napari._qt.utils import add_flash_animation, circle_pixmap, crosshair_pixmap, square_pixmap
 from napari._qt.widgets.qt_viewer_dock_widget import QtViewerDockWidget
 from napari.utils._proxies import ReadOnlyWrapper
 from napari.utils.interactions import (
@@ -431,7 +431,12 @@ class QtViewer(QSplitter):
         vispy_layer = self.layer_to_visual[layer]
         vispy_layer.close()
         del vispy_layer
-        self._reorder_layers(None)
+        # removing the top-most layer (e.g. when clearing all layers) does not change the order of the remaining ones
+        if event.index < len(self.viewer.layers):
+            self._reorder_layers(None)
+        else:
+            self.canvas._draw_order.clear()
+            self.canvas.update()
 
     def _reorder_layers(self, _event):
         """When the list is reordered, propagate changes to draw order.
@@ -473,7 +478,8 @@ class QtViewer(QSplitter):
         """
         from napari.utils.io import imsave
 
-        img = QImg2array(self.canvas.native.grabFramebuffer())
+        # render the scene to an offscreen framebuffer and read it straight into an array
+        img = self.canvas.render()
         if path is not None:
             imsave(path, img)
         return img
@@ -1,7 +1,9 @@
 """Development widgets."""
 
 import importlib
+import os
 import pkgutil
+import typing as ty
 from pathlib import Path
 
 from qtpy.QtCore import QFileSystemWatcher
@@ -20,10 +22,10 @@ def get_import_path(module: str) -> Path:
     return path.parent
 
 
-def path_to_module(path: str) -> str:
-    """Turn path into module name."""
-    module = path.split("napari_plot\\")[1]
-    return "napari_plot." + module.replace("\\", ".").replace(".py", "")
+def path_to_module(path: str, root: Path, package: str = "napari_plot") -> str:
+    """Turn path into module name, where `root` is the (resolved) directory of `package`."""
+    relative = Path(path).resolve().relative_to(root)
+    return ".".join((package, *relative.with_suffix("").parts))
 
 
 def get_parent_module(module: str):
@@ -44,55 +46,55 @@ class QtReload(QWidget):
         layout.addWidget(self._info, stretch=True)
         self.setLayout(layout)
 
+        # modification times of watched files, used to find which file changed in a directory
+        self._mtimes: ty.Dict[str, float] = {}
+        # directories that changed since the last reload
+        self._pending_directories: ty.Set[str] = set()
+        self._module = module
         self._path = get_import_path(module)
+        self._root = self._path.resolve() if self._path else None
         if self._path and auto_connect:
             self.setup_paths()
 
     def setup_paths(self):
-        """Setup paths.""" ""
-        self._add_filenames()
-        self._watcher.fileChanged.connect(self.on_reload_file)
-        # self._add_directories()
-        # self._watcher.directoryChanged.connect(self.on_reload_directory)
+        """Setup paths."""
+        # watching directories rather than files requires one watch per directory instead of one per file
+        self._add_directories()
+        self._watcher.directoryChanged.connect(self.on_reload_directory)
 
     @staticmethod
     def _get_paths(path: Path):
-        paths = []
-        for path in path.glob("**/*.py"):
-            if path.name == "__init__.py":
-                continue
-            paths.append(str(path))
-        paths = list(set(paths))
-        return paths
-
-    def _add_filenames(self):
-        """Set paths."""
-        paths = self._get_paths(self._path)
-        self._info.setText(f"Added {len(paths)} paths to watcher")
-        self._watcher.addPaths(paths)
+        return list({str(p) for p in path.glob("**/*.py") if p.name != "__init__.py"})
 
     @staticmethod
     def _get_directories(path):
-        paths = []
-        for path in path.glob("**/*.py"):
-            if path.name == "__init__.py":
-                continue
-            paths.append(str(path.parent))
-        paths = list(set(paths))
-        return paths
+        return list({str(p.parent) for p in path.glob("**/*.py") if p.name != "__init__.py"})
 
     def _add_directories(self):
         paths = self._get_directories(self._path)
+        for path in paths:
+            self._update_mtimes(Path(path))
         self._info.setText(f"Added {len(paths)} paths to watcher")
         self._watcher.addPaths(paths)
 
-    @qthrottled(timeout=500, leading=False)
-    def on_reload_file(self, path: str):
-        """Reload all modules."""
-        self._reload(path)
+    def _update_mtimes(self, path: Path) -> ty.List[str]:
+        """Record modification times of modules in directory and return those that changed since the last call."""
+        changed = []
+        for filename in path.glob("*.py"):
+            if filename.name == "__init__.py":
+                continue
+            filename = str(filename)
+            try:
+                mtime = os.path.getmtime(filename)
+            except OSError:  # file was removed in the meantime
+                continue
+            if self._mtimes.get(filename) != mtime:
+                self._mtimes[filename] = mtime
+                changed.append(filename)
+        return changed
 
     def _reload(self, path: str):
-        module = path_to_module(path)
+        module = path_to_module(path, self._root, self._module)
         try:
             res = xreload(importlib.import_module(module))
             self._info.setText(f"'{module}' (changed={res})")
@@ -101,7 +103,15 @@ class QtReload(QWidget):
             print(f"Failed to reload '{path}' {module}' Error={e}...")
 
     def on_reload_directory(self, path: str):
-        """Reload all modules in directory."""
-        paths = self._get_paths(Path(path))
-        for path in paths:
-            self._reload(path)
+        """Reload modules in directory that were modified."""
+        # editors emit several events per save so changed directories are collected and reloaded together
+        self._pending_directories.add(path)
+        self._reload_pending_directories()
+
+    @qthrottled(timeout=500, leading=False)
+    def _reload_pending_directories(self):
+        """Reload modified modules in all directories that changed since the last reload."""
+        directories, self._pending_directories = self._pending_directories, set()
+        for path in directories:
+            for filename in self._update_mtimes(Path(path)):
+                self._reload(filename)
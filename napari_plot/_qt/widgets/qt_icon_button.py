@@ -1,6 +1,7 @@
 """QtImagePushButton"""
 
 import typing as ty
+from functools import lru_cache
 
 import qtawesome
 from napari._qt.widgets.qt_mode_buttons import QtModePushButton as _QtModePushButton
@@ -23,6 +24,27 @@ SIZES = {
 }
 
 
+@lru_cache(maxsize=128)
+def _get_qta_icon(name: str, color: str, options: ty.Tuple[ty.Tuple[str, ty.Any], ...]):
+    """Return cached QtAwesome icon."""
+    return qtawesome.icon(name, **dict(options), color=color)
+
+
+def get_qta_icon(name: str, **kwargs):
+    """Get QtAwesome icon in the color of the current theme.
+
+    Icons are cached based on their name, color and options so re-creating the same icon (e.g. in multiple viewers)
+    does not need to re-render it.
+    """
+    if "." not in name:
+        name = QTA_MAPPING[name]
+    color = get_theme(get_settings().appearance.theme, False).icon.as_hex()
+    try:
+        return _get_qta_icon(name, color, tuple(sorted(kwargs.items())))
+    except TypeError:  # unhashable options
+        return qtawesome.icon(name, **kwargs, color=color)
+
+
 class QtaMixin:
     """Mixin class for buttons."""
 
@@ -34,10 +56,7 @@ class QtaMixin:
         if "." not in name:
             name = QTA_MAPPING[name]
         self._qta_data = (name, kwargs)
-        icon = qtawesome.icon(
-            name, **self._qta_data[1], color=get_theme(get_settings().appearance.theme, False).icon.as_hex()
-        )
-        self.setIcon(icon)
+        self.setIcon(get_qta_icon(name, **kwargs))
 
     def set_size(self, size: ty.Tuple[int, int]):
         """Set size of the button."""
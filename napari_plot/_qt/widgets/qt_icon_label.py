@@ -1,12 +1,12 @@
 """QtIconLabel"""
 
-import qtawesome
 from napari.settings import get_settings
 from napari.utils.events.event_utils import connect_no_arg
-from napari.utils.theme import _themes, get_theme
+from napari.utils.theme import _themes
 from qtpy.QtCore import QSize, Qt
 from qtpy.QtWidgets import QLabel
 
+from napari_plot._qt.widgets.qt_icon_button import get_qta_icon
 from napari_plot.resources import QTA_MAPPING
 
 SIZES = {
@@ -45,10 +45,7 @@ class QtQtaLabel(QtIconLabel):
         if "." not in name:
             name = QTA_MAPPING[name]
         self._qta_data = (name, kwargs)
-        icon = qtawesome.icon(
-            name, **self._qta_data[1], color=get_theme(get_settings().appearance.theme, False).icon.as_hex()
-        )
-        self.setIcon(icon)
+        self.setIcon(get_qta_icon(name, **kwargs))
 
     def set_size_name(self, size_name: str):
         """Set size of the icon based on pre-defined stylesheet selector."""
@@ -11,3 +11,45 @@ def test_VispyScatterLayer(opacity):
     layer = Scatter(points, size=30, opacity=opacity)
     visual = VispyScatterLayer(layer)
     assert visual.node.opacity == opacity
+
+
+def test_VispyScatterLayer_swap_xy():
+    points = np.array([[100, 150], [200, 250], [300, 350]])
+    layer = Scatter(points)
+    visual = VispyScatterLayer(layer)
+    swapped = visual._swap_xy(layer.data)
+    np.testing.assert_array_equal(swapped, layer.data[:, ::-1])
+    assert swapped.flags["C_CONTIGUOUS"]
+    assert swapped.dtype == np.float32
+    # buffer is re-used when the shape does not change
+    assert visual._swap_xy(layer.data) is swapped
+
+
+def test_VispyScatterLayer_style_change_keeps_positions():
+    points = np.array([[100, 150], [200, 250], [300, 350]])
+    layer = Scatter(points)
+    visual = VispyScatterLayer(layer)
+    swapped = visual._data_swapped
+    layer.face_color = "red"
+    assert visual._data_swapped is swapped
+    np.testing.assert_array_equal(visual._data_swapped, points[:, ::-1])
+
+
+def test_VispyScatterLayer_style_change_skips_same_style():
+    points = np.array([[100, 150], [200, 250], [300, 350]])
+    layer = Scatter(points, face_color="red")
+    visual = VispyScatterLayer(layer)
+    style = visual._last_style
+    layer.face_color = "red"
+    assert visual._last_style is style
+    layer.face_color = "blue"
+    assert visual._last_style is not style
+
+
+def test_VispyScatterLayer_hidden_text():
+    points = np.array([[100, 150], [200, 250], [300, 350]])
+    layer = Scatter(points, properties={"label": ["a", "b", "c"]}, text={"string": "label", "visible": False})
+    visual = VispyScatterLayer(layer)
+    assert visual._text_hidden
+    layer.text.visible = True
+    assert not visual._text_hidden
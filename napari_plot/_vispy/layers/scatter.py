@@ -20,6 +20,14 @@ MARKERS_HIGHLIGHT = 1
 RECT_HIGHLIGHT = 2
 TEXT = 3
 
+# read-only placeholders used whenever there is nothing to display, vispy copies the data so these can be shared
+EMPTY_POS = np.zeros((1, 2))
+EMPTY_POS.flags.writeable = False
+EMPTY_EDGE_COLOR = np.array([[0.0, 0.0, 0.0, 1.0]], dtype=np.float32)
+EMPTY_EDGE_COLOR.flags.writeable = False
+EMPTY_FACE_COLOR = np.array([[1.0, 1.0, 1.0, 1.0]], dtype=np.float32)
+EMPTY_FACE_COLOR.flags.writeable = False
+
 
 class VispyScatterLayer(VispyBaseLayer):
     """Line layer"""
@@ -29,19 +37,25 @@ class VispyScatterLayer(VispyBaseLayer):
 
     def __init__(self, layer: "Scatter"):
         node = ScatterVisual()
+        # re-usable buffer with the data in vispy's x/y order
+        self._data_swapped = None
+        # appearance of the points that was last sent to vispy
+        self._last_style = None
+        # flag to indicate that the text node already shows the (empty) hidden text
+        self._text_hidden = False
         super().__init__(layer, node)
 
         self.layer.events.symbol.connect(self._on_symbol_change)
         self.layer.events.scaling.connect(self._on_scaling_change)
-        self.layer.events.symbol.connect(self._on_data_change)
-        self.layer.events.edge_width.connect(self._on_data_change)
-        self.layer.events.edge_width_is_relative.connect(self._on_data_change)
-        self.layer.events.edge_color.connect(self._on_data_change)
-        self.layer._edge.events.colors.connect(self._on_data_change)
-        self.layer._edge.events.color_properties.connect(self._on_data_change)
-        self.layer.events.face_color.connect(self._on_data_change)
-        self.layer._face.events.colors.connect(self._on_data_change)
-        self.layer._face.events.color_properties.connect(self._on_data_change)
+        self.layer.events.symbol.connect(self._on_style_change)
+        self.layer.events.edge_width.connect(self._on_style_change)
+        self.layer.events.edge_width_is_relative.connect(self._on_style_change)
+        self.layer.events.edge_color.connect(self._on_style_change)
+        self.layer._edge.events.colors.connect(self._on_style_change)
+        self.layer._edge.events.color_properties.connect(self._on_style_change)
+        self.layer.events.face_color.connect(self._on_style_change)
+        self.layer._face.events.colors.connect(self._on_style_change)
+        self.layer._face.events.color_properties.connect(self._on_style_change)
         self.layer.events.highlight.connect(self._on_highlight_change)
         self.layer.text.events.connect(self._on_text_change)
         # self.layer.events.shading.connect(self._on_shading_change)
@@ -71,45 +85,57 @@ class VispyScatterLayer(VispyBaseLayer):
         self.node.canvas_size_limits = self.layer.canvas_size_limits
 
     def _on_data_change(self):
+        """Update position and appearance of the points."""
+        # Set vispy data, noting that the rows / columns need to be switched for vispy's x / y ordering
+        if len(self.layer._indices_view) == 0:
+            pos = self._swap_xy(EMPTY_POS)
+        else:
+            pos = self._swap_xy(self.layer._view_data)
+        self._set_markers_data(pos)
+        self.reset()
+
+    def _on_style_change(self):
+        """Update appearance of the points without re-computing their positions."""
+        pos = self._data_swapped
+        if pos is None or len(pos) != max(len(self.layer._indices_view), 1):
+            self._on_data_change()
+            return
+        if self._set_markers_data(pos, force=False):
+            self._on_highlight_change()
+
+    def _set_markers_data(self, pos: np.ndarray, force: bool = True) -> bool:
+        """Set data on the main markers visual using already ordered positions.
+
+        Parameters
+        ----------
+        pos : np.ndarray
+            Positions of the points in vispy's x/y order.
+        force : bool
+            If False, data is only sent to vispy if the appearance of the points changed since the last call. This
+            avoids re-uploading the data when several events are emitted for a single change (e.g. `face_color` and
+            `colors` events).
+
+        Returns
+        -------
+        updated : bool
+            Flag to indicate whether the data was sent to vispy.
+        """
         if len(self.layer._indices_view) > 0:
             edge_color = self.layer._view_edge_color
             face_color = self.layer._view_face_color
+            size = self.layer._view_size
+            edge_width = self.layer._view_edge_width
         else:
-            edge_color = np.array([[0.0, 0.0, 0.0, 1.0]], dtype=np.float32)
-            face_color = np.array([[1.0, 1.0, 1.0, 1.0]], dtype=np.float32)
-
-            # Set vispy data, noting that the order of the points needs to be
-            # reversed to make the most recently added point appear on top
-            # and the rows / columns need to be switched for vispy's x / y ordering
-        if len(self.layer._indices_view) == 0:
-            data = np.zeros((1, self.layer._ndisplay))
+            edge_color = EMPTY_EDGE_COLOR
+            face_color = EMPTY_FACE_COLOR
             size = [0]
             edge_width = [0]
-        else:
-            data = self.layer._view_data
-            size = self.layer._view_size
-            edge_width = self.layer._view_edge_width
 
-        # # Set vispy data, noting that the order of the points needs to be
-        # # reversed to make the most recently added point appear on top
-        # # and the rows / columns need to be switched for vispy's x / y ordering
-        # if len(self.layer._indices_view) == 0:
-        #     # always pass one invisible point to avoid issues
-        #     data = np.zeros((1, self.layer._ndisplay))
-        #     size = [0]
-        #     edge_color = np.array([[0.0, 0.0, 0.0, 1.0]], dtype=np.float32)
-        #     face_color = np.array([[1.0, 1.0, 1.0, 1.0]], dtype=np.float32)
-        #     edge_width = [0]
-        #     symbol = ["o"]
-        # else:
-        #     data = self.layer._view_data
-        #     size = self.layer._view_size
-        #     edge_color = self.layer._view_edge_color
-        #     face_color = self.layer._view_face_color
-        #     edge_width = self.layer._view_edge_width
-        #     symbol = self.layer._view_symbol
-
-        set_data = self.node._subvisuals[MARKERS_MAIN].set_data
+        style = (self.layer.edge_width_is_relative, edge_color, face_color, size, edge_width)
+        if not force and self._last_style is not None:
+            if all(np.array_equal(new, old) for new, old in zip(style, self._last_style)):
+                return False
+        self._last_style = style
 
         if self.layer.edge_width_is_relative:
             edge_kw = {
@@ -122,21 +148,40 @@ class VispyScatterLayer(VispyBaseLayer):
                 "edge_width_rel": None,
             }
 
-        set_data(
-            data[:, ::-1],
+        self.node._subvisuals[MARKERS_MAIN].set_data(
+            pos,
             size=size,
-            # symbol=symbol,
             edge_color=edge_color,
             face_color=face_color,
             **edge_kw,
         )
+        return True
 
-        self.reset()
+    def _swap_xy(self, data: np.ndarray) -> np.ndarray:
+        """Return C-contiguous float32 copy of the data with the columns in vispy's x/y order.
+
+        The buffer is re-used between calls for as long as the shape of the data does not change which avoids
+        allocating new array on every update. Positions are stored as float32 since that's what vispy uploads to the
+        GPU, while the layer keeps the data in its original precision.
+        """
+        buffer = self._data_swapped
+        if buffer is None or buffer.shape != data.shape:
+            buffer = self._data_swapped = np.empty(data.shape, dtype=np.float32)
+        buffer[:, 0] = data[:, 1]
+        buffer[:, 1] = data[:, 0]
+        return buffer
 
     def _on_symbol_change(self):
         self.node.symbol = self.layer.symbol
 
-    def _on_highlight_change(self):
+    def _on_highlight_change(self, _event=None, *, update_node=True):
+        """Update highlight of the hovered/selected points.
+
+        Parameters
+        ----------
+        update_node : bool
+            If true, update the node after setting the highlight
+        """
         if len(self.layer._highlight_index) > 0:
             # Color the hovered or selected points
             data = self.layer._view_data[self.layer._highlight_index]
@@ -145,7 +190,7 @@ class VispyScatterLayer(VispyBaseLayer):
             size = self.layer._view_size[self.layer._highlight_index]
             # symbol = self.layer._view_symbol[self.layer._highlight_index]
         else:
-            data = np.zeros((1, self.layer._ndisplay))
+            data = EMPTY_POS
             size = 0
             # symbol = ["o"]
 
@@ -159,7 +204,7 @@ class VispyScatterLayer(VispyBaseLayer):
         )
 
         if self.layer._highlight_box is None or 0 in self.layer._highlight_box.shape:
-            pos = np.zeros((1, self.layer._ndisplay))
+            pos = EMPTY_POS
             width = 0
         else:
             pos = self.layer._highlight_box
@@ -170,8 +215,8 @@ class VispyScatterLayer(VispyBaseLayer):
             color=self._highlight_color,
             width=width,
         )
-
-        self.node.update()
+        if update_node:
+            self.node.update()
 
     def _update_text(self, *, update_node=True):
         """Function to update the text node properties
@@ -181,6 +226,13 @@ class VispyScatterLayer(VispyBaseLayer):
         update_node : bool
             If true, update the node after setting the properties
         """
+        # hidden text is displayed using placeholder values so there is no need to set them again
+        if not self.layer.text.visible:
+            if self._text_hidden:
+                return
+            self._text_hidden = True
+        else:
+            self._text_hidden = False
         update_text(node=self.node._subvisuals[TEXT], layer=self.layer)
         if update_node:
             self.node.update()
@@ -211,8 +263,10 @@ class VispyScatterLayer(VispyBaseLayer):
 
     def reset(self):
         super().reset()
+        # request single redraw after all sub-visuals had been updated
         self._update_text(update_node=False)
-        self._on_highlight_change()
+        self._on_highlight_change(update_node=False)
+        self.node.update()
         # self._on_antialiasing_change()
         # self._on_shading_change()
         # self._on_canvas_size_limits_change()
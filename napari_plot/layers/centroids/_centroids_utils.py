@@ -10,7 +10,8 @@ def parse_centroids_data(data: np.ndarray):
     if data is None:
         return np.empty((0, 3))
 
-    data = np.asarray(data)
+    # keep data C-contiguous so that column-wise reductions and copies to the visual do not need to stride
+    data = np.ascontiguousarray(data)
     # If data includes upper and lower boundaries, return it
     if data.shape[1] == 3:
         return data
@@ -23,13 +24,13 @@ def parse_centroids_data(data: np.ndarray):
 
 def get_extents(data: np.ndarray, orientation: str) -> np.ndarray:
     """Get data extents."""
+    # reduce all columns in one pass over the (row-major) data rather than once per strided column selection
+    mins, maxs = data.min(axis=0), data.max(axis=0)
+    pos_min, pos_max = mins[0], maxs[0]
+    value_min, value_max = mins[1:].min(), maxs[1:].max()
     if orientation == "horizontal":
-        y = data[:, 0]
-        x = data[:, 1::]
-    else:
-        x = data[:, 0]
-        y = data[:, 1::]
-    return np.array([[np.min(y), np.min(x)], [np.max(y), np.max(x)]])
+        return np.array([[pos_min, value_min], [pos_max, value_max]])
+    return np.array([[value_min, pos_min], [value_max, pos_max]])
 
 
 def make_centroids(data: np.ndarray, color: np.ndarray, orientation: str) -> ty.Tuple[np.ndarray, np.ndarray]:
@@ -49,6 +49,23 @@ def test_centroids_change_data():
     assert len(layer.color) == 15
 
 
+def test_centroids_change_data_keeps_color():
+    data = np.random.random((3, 3))
+    layer = Centroids(data, color="red")
+    layer.update_color(2, np.array((0.0, 1.0, 0.0, 1.0)))
+
+    # new centroids inherit the color of the last centroid
+    layer.data = np.random.random((5, 3))
+    np.testing.assert_array_equal(layer.color[0], [1.0, 0.0, 0.0, 1.0])
+    np.testing.assert_array_equal(layer.color[3:], [[0.0, 1.0, 0.0, 1.0]] * 2)
+
+    # trimmed colors do not share memory with the previous array
+    color = layer.color
+    layer.data = np.random.random((2, 3))
+    assert layer.color.shape == (2, 4)
+    assert not np.shares_memory(color, layer.color)
+
+
 def test_centroids_color():
     data = np.random.random((10, 3))
     layer = Centroids(data, color="white")
@@ -56,6 +73,7 @@ def test_centroids_color():
 
     layer = Centroids(data, color="red")
     np.testing.assert_array_equal(layer.color[0], np.asarray([1.0, 0.0, 0.0, 1.0]))
+    assert layer.color.dtype == np.float32
 
 
 def test_centroids_color_change():
@@ -70,6 +88,13 @@ def test_centroids_color_change():
     layer.update_color(1, np.array((1.0, 0.0, 1.0, 1.0)))
     np.testing.assert_array_equal(layer.color[1], np.asarray([1.0, 0.0, 1.0, 1.0]))
 
+    # arrays of colors are copied rather than referenced
+    color = np.full((10, 4), fill_value=(0.0, 0.0, 1.0, 1.0))
+    layer.color = color
+    assert layer.color.dtype == np.float32
+    layer.update_color(0, np.array((1.0, 0.0, 0.0, 1.0)))
+    np.testing.assert_array_equal(color[0], np.asarray([0.0, 0.0, 1.0, 1.0]))
+
     data = np.random.random((0, 3))
     layer.data = data
     assert len(layer.color) == len(data)
@@ -77,3 +102,55 @@ def test_centroids_color_change():
     data = np.random.random((5, 3))
     layer.data = data
     assert len(layer.color) == len(data)
+
+
+@pytest.mark.parametrize("orientation", ["vertical", "horizontal"])
+def test_centroids_xy(orientation):
+    x, y = np.arange(10), np.random.random(10)
+    layer = Centroids(x=x, y=y, orientation=orientation)
+    assert layer.data.shape == (10, 3)
+    if orientation == "vertical":
+        np.testing.assert_array_equal(layer.data[:, 0], x)
+        np.testing.assert_array_equal(layer.data[:, 2], y)
+    else:
+        np.testing.assert_array_equal(layer.data[:, 0], y)
+        np.testing.assert_array_equal(layer.data[:, 2], x)
+
+
+def test_centroids_extent_updates():
+    data = np.array([[0, 0, 1], [10, 0, 5]], dtype=np.float64)
+    layer = Centroids(data)
+    np.testing.assert_array_equal(layer._extent_data, [[0, 0], [5, 10]])
+    assert layer._extent_data is layer._extent_data
+
+    layer.data = np.array([[0, 0, 1], [20, 0, 8]], dtype=np.float64)
+    np.testing.assert_array_equal(layer._extent_data, [[0, 0], [8, 20]])
+
+    layer.orientation = "horizontal"
+    np.testing.assert_array_equal(layer._extent_data, [[0, 0], [20, 8]])
+
+
+def test_centroids_same_data_no_event():
+    data = np.random.random((10, 3))
+    layer = Centroids(data)
+    calls = []
+    layer.events.data.connect(lambda e: calls.append(e))
+
+    layer.data = data.copy()
+    assert not calls
+
+    # assigning the same array (e.g. after modifying it in-place) still updates the layer
+    layer.data = layer.data
+    assert len(calls) == 1
+
+
+def test_centroids_update_color_unchanged():
+    data = np.random.random((10, 3))
+    layer = Centroids(data, color="red")
+    calls = []
+    layer.events.color.connect(lambda e: calls.append(e))
+
+    layer.update_color(0, (1.0, 0.0, 0.0, 1.0))
+    assert not calls
+    layer.update_color(0, (0.0, 0.0, 1.0, 1.0))
+    assert len(calls) == 1
@@ -7,6 +7,7 @@ from napari.utils.events import Event
 from napari_plot.layers.base import BaseLayer
 from napari_plot.layers.centroids._centroids_constants import Method, Orientation
 from napari_plot.layers.centroids._centroids_utils import get_extents, parse_centroids_data
+from napari_plot.utils.utilities import get_data_from_xy
 
 
 class Centroids(BaseLayer):
@@ -19,6 +20,10 @@ class Centroids(BaseLayer):
         upper value and the lower value is assumed to be zero. If array has shape (N, 3) then its assumed that its the
         position, lower value and upper value. X-axis and Y-axis values are inferred based on the orientation attribute.
         Coordinates for N points in 2 dimensions.
+    x : array (N,), optional
+        The x-axis values. Can be specified together with `y` instead of `data`.
+    y : array (N,), optional
+        The y-axis values. Can be specified together with `x` instead of `data`.
     orientation : str or Orientation
         If string, can be `vertical` or `horizontal
     color : str, array-like
@@ -57,11 +62,18 @@ class Centroids(BaseLayer):
         Whether the layer visual is currently being displayed.
     """
 
+    # Data-independent thumbnail, created on first use
+    _thumbnail_base = None
+    # Extents of the current data, cleared whenever data or orientation changes
+    _extent_cache = None
+
     def __init__(
         self,
-        data,
+        data=None,
         *,
         # napari-plot parameters
+        x=None,
+        y=None,
         orientation="vertical",
         color=(1.0, 1.0, 1.0, 1.0),
         width=2,
@@ -79,7 +91,8 @@ class Centroids(BaseLayer):
         blending="translucent",
         visible=True,
     ):
-        # sanitize data
+        # sanitize data, in horizontal centroids the position is along the y-axis
+        data = get_data_from_xy(data, x, y, yx=Orientation(orientation) == Orientation.HORIZONTAL)
         data = parse_centroids_data(data)
         super().__init__(
             data,
@@ -121,6 +134,9 @@ class Centroids(BaseLayer):
         init_colors : (N, 4) array
             The calculated values for setting edge or face_color
         """
+        if isinstance(color, np.ndarray) and color.shape == (n_lines, 4) and color.dtype in (np.float32, np.float64):
+            # already an array of RGBA colors, skip the per-color parsing
+            return np.array(color, dtype=np.float32)
         if n_lines > 0:
             transformed_color = transform_color_with_defaults(
                 num_entries=n_lines,
@@ -130,8 +146,8 @@ class Centroids(BaseLayer):
             )
             init_colors = normalize_and_broadcast_colors(n_lines, transformed_color)
         else:
-            init_colors = np.empty((0, 4))
-        return init_colors
+            init_colors = np.empty((0, 4), dtype=np.float32)
+        return init_colors.astype(np.float32, copy=False)
 
     def update_color(self, index: int, color: np.ndarray):
         """Update color of single line.
@@ -143,6 +159,10 @@ class Centroids(BaseLayer):
         color : str | tuple | np.ndarray
             Color of the line.
         """
+        color = np.asarray(color, dtype=self._color.dtype)
+        # color pickers can emit the same color repeatedly, so avoid redrawing if nothing changed
+        if np.array_equal(self._color[index], color):
+            return
         self._color[index] = color
         self.events.color()
         self._update_thumbnail()
@@ -155,15 +175,21 @@ class Centroids(BaseLayer):
     @orientation.setter
     def orientation(self, value):
         self._orientation = Orientation(value)
+        self._extent_cache = None
         self.events.set_data()
 
     def _update_thumbnail(self):
         """Update thumbnail with current data"""
         if self._allow_thumbnail_update:
-            h = self._thumbnail_shape[0]
-            thumbnail = np.zeros(self._thumbnail_shape)
-            thumbnail[..., 3] = 1
-            thumbnail[h - 2 : h + 2, :] = 1  # horizontal strip
+            # the thumbnail does not depend on the data so only the opacity needs to be applied each time
+            base = self._thumbnail_base
+            if base is None or base.shape != tuple(self._thumbnail_shape):
+                h = self._thumbnail_shape[0]
+                base = np.zeros(self._thumbnail_shape)
+                base[..., 3] = 1
+                base[h - 2 : h + 2, :] = 1  # horizontal strip
+                self._thumbnail_base = base
+            thumbnail = base.copy()
             thumbnail[..., 3] *= self.opacity
             self.thumbnail = thumbnail
 
@@ -191,19 +217,26 @@ class Centroids(BaseLayer):
         If the number of centroids is larger than what's currently set, colors will be append
         """
         data = parse_centroids_data(value)
-        color = self.color
+        # nothing to update if a copy of the current data was assigned; assigning the same array object still
+        # triggers an update so that `layer.data = layer.data` refreshes the layer after in-place changes
+        if data is not self._data and data.shape == self._data.shape and np.array_equal(data, self._data):
+            return
+        color = self._color
         n = len(self._data)
         n_new = len(data)
         # fewer centroids, trim attributes
         if n > n_new:
-            color = self.color[:n_new]
+            color = color[:n_new].copy()
         # more centroids, add attributes
         elif n < n_new:
-            n_difference = n_new - n
-            new_color = color[-1] if len(color) > 0 else np.array((1.0, 1.0, 1.0, 1.0))
-            color = np.concatenate([color, np.full((n_difference, 4), fill_value=new_color)])
+            color = np.empty((n_new, 4), dtype=self._color.dtype)
+            color[:n] = self._color
+            color[n:] = self._color[-1] if n > 0 else 1.0
+        # colors are already normalized so there is no need to go through the `color` setter
         self._data = data
-        self.color = color
+        self._extent_cache = None
+        self._color = color
+        self.events.color()
         self._emit_new_data()
 
     @property
@@ -258,9 +291,14 @@ class Centroids(BaseLayer):
 
     @property
     def _extent_data(self) -> np.ndarray:
-        if len(self.data) == 0:
-            return np.full((2, 2), np.nan)
-        return get_extents(self.data, self.orientation)
+        if self._extent_cache is None:
+            if len(self.data) == 0:
+                extent = np.full((2, 2), np.nan)
+            else:
+                extent = get_extents(self.data, self.orientation)
+            extent.flags.writeable = False
+            self._extent_cache = extent
+        return self._extent_cache
 
     # def _get_x_region_extent(self, x_min: float, x_max: float):
     #     """Return data extents in the (xmin, xmax, ymin, ymax) format."""
@@ -17,6 +17,13 @@ def test_line_data(data):
     assert isinstance(layer.data, np.ndarray)
 
 
+def test_line_xy():
+    x, y = np.arange(10), np.random.random(10)
+    layer = Line(x=x, y=y)
+    np.testing.assert_array_equal(layer.x, x)
+    np.testing.assert_array_equal(layer.y, y)
+
+
 def test_line_change_data():
     data = np.random.random((10, 2))
     layer = Line(data)
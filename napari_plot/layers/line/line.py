@@ -6,6 +6,7 @@ from napari.utils.events import Event
 
 from napari_plot.layers.base import BaseLayer
 from napari_plot.layers.line._line_constants import Method
+from napari_plot.utils.utilities import get_data_from_xy
 
 
 class Line(BaseLayer):
@@ -15,6 +16,10 @@ class Line(BaseLayer):
     ----------
     data : array (N, 2)
         Coordinates for N points in 2 dimensions.
+    x : array (N,), optional
+        The x-axis values. Can be specified together with `y` instead of `data`.
+    y : array (N,), optional
+        The y-axis values. Can be specified together with `x` instead of `data`.
     color : str, array-like
         If string can be any color name recognized by vispy or hex value if starting with `#`. If array-like must
         be 1-dimensional array with 3 or 4 elements.
@@ -57,9 +62,11 @@ class Line(BaseLayer):
 
     def __init__(
         self,
-        data,
+        data=None,
         *,
         # napari-plot parameters
+        x=None,
+        y=None,
         color=(1.0, 1.0, 1.0, 1.0),
         width=2,
         method="gl",
@@ -77,6 +84,7 @@ class Line(BaseLayer):
         visible=True,
     ):
         # sanitize data
+        data = get_data_from_xy(data, x, y)
         if data is None:
             data = np.empty((0, 2))
         else:
@@ -69,16 +69,13 @@ def parse_multiline_data(data, check: bool = True) -> ty.Tuple[ty.List[np.ndarra
 
 def make_multiline_line(xs: ty.List, ys: ty.List, colors: np.ndarray):
     """Create all elements required to create multiline lines."""
-    pos, connect, _colors = [], [], []
+    connect, _colors = [], []
     if len(xs) == 1:
         xs = [xs[0]] * len(ys)
 
     start = 0
     for x, y, color in zip(xs, ys, colors):
         n = len(x)
-        # data
-        pos.append(np.c_[x, y])
-
         # connect
         _connect = np.empty((n - 1, 2), np.float32)
         _connect[:, 0] = np.arange(start=start, stop=start + n - 1)
@@ -88,22 +85,29 @@ def make_multiline_line(xs: ty.List, ys: ty.List, colors: np.ndarray):
 
         # add color
         _colors.append(np.full((n, 4), fill_value=color, dtype=np.float32))
-    pos = np.vstack(pos)
+    pos = make_multiline_pos(xs, ys)
     colors = np.vstack(_colors)
     connect = np.vstack(connect)
     return pos, connect, colors
 
 
 def make_multiline_pos(xs: ty.List, ys: ty.List):
-    """Create array of how points should be connected."""
-    pos = []
+    """Create array of positions of all lines.
 
+    The output array is allocated once and each line is written directly into it, rather than creating (N, 2) array
+    for each line and stacking them afterwards.
+    """
     if len(xs) == 1:
         xs = [xs[0]] * len(ys)
+    dtype = np.result_type(*{x.dtype for x in xs}, *{y.dtype for y in ys})
+    pos = np.empty((sum(len(y) for y in ys), 2), dtype=dtype)
+    start = 0
     for x, y in zip(xs, ys):
-        # data
-        pos.append(np.c_[x, y])
-    return np.vstack(pos)
+        end = start + len(y)
+        pos[start:end, 0] = x
+        pos[start:end, 1] = y
+        start = end
+    return pos
 
 
 def make_multiline_connect(ys: ty.List):
@@ -33,7 +33,7 @@ class RegionList:
     orientations : (N, ) list of str
         Name of shape type for each region.
     color : (N x 4) np.ndarray
-        Array of RGBA face colors for each shape.
+        Array of RGBA float32 face colors for each shape.
     z_indices : (N, ) list of int
         z-index for each shape.
 
@@ -67,7 +67,8 @@ class RegionList:
         self._z_order = np.empty(0, dtype=int)
 
         self._mesh = Mesh(ndisplay=self.ndisplay)
-        self._color = np.empty((0, 4))
+        self._color = np.empty((0, 4), dtype=np.float32)
+        self._data_cache = None
 
         for d in data:
             self.add(d)
@@ -75,7 +76,15 @@ class RegionList:
     @property
     def data(self):
         """list of (M, D) array: data arrays for each shape."""
-        return [s.data for s in self.regions]
+        # the list is cached until regions are added, removed or edited
+        if self._data_cache is None:
+            self._data_cache = [s.data for s in self.regions]
+        return list(self._data_cache)
+
+    @property
+    def n_regions(self) -> int:
+        """int: Number of regions."""
+        return len(self.regions)
 
     @property
     def ndisplay(self):
@@ -126,19 +135,22 @@ class RegionList:
             The value for setting edge or color. There must
             be one color for each shape
         """
-        n_shapes = len(self.data)
+        n_shapes = self.n_regions
         if not np.all(colors.shape == (n_shapes, 4)):
             raise ValueError(f"color must have shape ({n_shapes}, 4)")
 
-        for i, col in enumerate(colors):
-            self.update_color(i, col, update=False)
-        self._update_displayed()
+        self.update_colors(np.arange(n_shapes), colors)
 
     @property
     def z_indices(self) -> ty.List[int]:
         """list of int: z-index for each shape."""
         return [s.z_index for s in self.regions]
 
+    @property
+    def next_z_index(self) -> int:
+        """int: z-index that places a new region on top of all others."""
+        return int(self._z_index.max()) + 1 if self._z_index.size else 0
+
     @property
     def slice_key(self):
         """list: slice key for slicing n-dimensional shapes."""
@@ -205,6 +217,7 @@ class RegionList:
         """
         if not isinstance(shape, Rectangle):
             raise ValueError("Region must be a class of Rectangle")
+        self._data_cache = None
 
         if shape_index is None:
             shape_index = len(self.regions)
@@ -212,7 +225,7 @@ class RegionList:
             self._z_index = np.append(self._z_index, shape.z_index)
 
             if color is None:
-                color = np.array([1, 1, 1, 1])
+                color = np.ones(4, dtype=np.float32)
             self._color = np.vstack([self._color, color])
         else:
             z_refresh = False
@@ -250,9 +263,68 @@ class RegionList:
             # Set z_order
             self._update_z_order()
 
+    def extend(self, regions, color=None):
+        """Adds multiple Region objects at once.
+
+        Unlike calling `add` for each region, the vertex and mesh arrays are only concatenated once and the z order is
+        updated at the end.
+
+        Parameters
+        ----------
+        regions : list of Rectangle
+            Regions to be appended to the list.
+        color : (N, 4) np.ndarray, optional
+            Array of RGBA colors, one for each region. If None, regions will be white.
+        """
+        if any(not isinstance(region, Rectangle) for region in regions):
+            raise ValueError("Region must be a class of Rectangle")
+        if len(regions) == 0:
+            return
+        self._data_cache = None
+        if color is None:
+            color = np.ones((len(regions), 4), dtype=np.float32)
+        color = np.asarray(color, dtype=np.float32)
+
+        start = len(self.regions)
+        m = len(self._mesh.vertices)
+        vertices, index = [self._vertices], [self._index]
+        mesh_vertices, mesh_index = [], []
+        triangles, triangles_index, triangles_colors = [], [], []
+        for shape_index, (shape, col) in enumerate(zip(regions, color), start=start):
+            vertices.append(shape.data_displayed)
+            index.append(np.repeat(shape_index, len(shape.data)))
+
+            face_vertices = shape._face_vertices
+            mesh_vertices.append(face_vertices)
+            mesh_index.append(np.repeat([[shape_index, 0]], len(face_vertices), axis=0))
+            face_triangles = shape._face_triangles
+            triangles.append(face_triangles + m)
+            triangles_index.append(np.repeat([[shape_index, 0]], len(face_triangles), axis=0))
+            triangles_colors.append(np.repeat([col], len(face_triangles), axis=0))
+            m += len(face_vertices)
+
+        self.regions.extend(regions)
+        self._z_index = np.append(self._z_index, [shape.z_index for shape in regions])
+        self._color = np.concatenate((self._color, color), axis=0)
+        self._vertices = np.concatenate(vertices, axis=0)
+        self._index = np.concatenate(index, axis=0)
+
+        mesh_vertices = np.concatenate(mesh_vertices, axis=0)
+        self._mesh.vertices = np.concatenate((self._mesh.vertices, mesh_vertices), axis=0)
+        self._mesh.vertices_centers = np.concatenate((self._mesh.vertices_centers, mesh_vertices), axis=0)
+        self._mesh.vertices_offsets = np.concatenate(
+            (self._mesh.vertices_offsets, np.zeros(mesh_vertices.shape)), axis=0
+        )
+        self._mesh.vertices_index = np.concatenate([self._mesh.vertices_index] + mesh_index, axis=0)
+        self._mesh.triangles = np.concatenate([self._mesh.triangles] + triangles, axis=0)
+        self._mesh.triangles_index = np.concatenate([self._mesh.triangles_index] + triangles_index, axis=0)
+        self._mesh.triangles_colors = np.concatenate([self._mesh.triangles_colors] + triangles_colors, axis=0)
+        self._update_z_order()
+
     def remove_all(self):
         """Removes all shapes"""
         self.regions = []
+        self._data_cache = None
         self._vertices = np.empty((0, self.ndisplay))
         self._index = np.empty(0, dtype=int)
         self._z_index = np.empty(0, dtype=int)
@@ -272,6 +344,7 @@ class RegionList:
             expectation is that this shape is being immediately added back to the
             list using `add_shape`.
         """
+        self._data_cache = None
         indices = self._index != index
         self._vertices = self._vertices[indices]
         self._index = self._index[indices]
@@ -305,6 +378,53 @@ class RegionList:
             self._mesh.vertices_index[indices, 0] = self._mesh.vertices_index[indices, 0] - 1
             self._update_z_order()
 
+    def remove_many(self, indices):
+        """Removes multiple regions at once.
+
+        Unlike `remove`, this also removes the color of each region and renumbers the remaining regions only once.
+
+        Parameters
+        ----------
+        indices : iterable of int
+            Locations in list of the regions to be removed.
+        """
+        indices = np.fromiter(indices, dtype=int)
+        if indices.size == 0:
+            return
+        self._data_cache = None
+        keep = np.ones(len(self.regions), dtype=bool)
+        keep[indices] = False
+        # new position of each of the retained regions
+        new_index = np.cumsum(keep) - 1
+
+        self.regions = [region for region, retain in zip(self.regions, keep) if retain]
+        self._z_index = self._z_index[keep]
+        self._color = self._color[keep]
+
+        mask = keep[self._index]
+        self._vertices = self._vertices[mask]
+        self._index = new_index[self._index[mask]]
+
+        # Remove vertices and remap the triangles onto the retained vertices
+        mask = keep[self._mesh.vertices_index[:, 0]]
+        new_vertex = np.cumsum(mask) - 1
+        self._mesh.vertices = self._mesh.vertices[mask]
+        self._mesh.vertices_centers = self._mesh.vertices_centers[mask]
+        self._mesh.vertices_offsets = self._mesh.vertices_offsets[mask]
+        vertices_index = self._mesh.vertices_index[mask]
+        vertices_index[:, 0] = new_index[vertices_index[:, 0]]
+        self._mesh.vertices_index = vertices_index
+
+        # Remove triangles
+        mask = keep[self._mesh.triangles_index[:, 0]]
+        triangles = self._mesh.triangles[mask]
+        self._mesh.triangles = new_vertex[triangles].astype(triangles.dtype, copy=False)
+        self._mesh.triangles_colors = self._mesh.triangles_colors[mask]
+        triangles_index = self._mesh.triangles_index[mask]
+        triangles_index[:, 0] = new_index[triangles_index[:, 0]]
+        self._mesh.triangles_index = triangles_index
+        self._update_z_order()
+
     def _update_mesh_vertices(self, index, edge=False, face=False):
         """Updates the mesh vertex data and vertex data for a single shape
         located at index.
@@ -321,6 +441,7 @@ class RegionList:
             faces and to update the underlying shape vertices
         """
         shape = self.regions[index]
+        self._data_cache = None
         if edge:
             indices = np.all(self._mesh.vertices_index == [index, 1], axis=1)
             self._mesh.vertices[indices] = shape._edge_vertices + shape.edge_width * shape._edge_offsets
@@ -368,6 +489,7 @@ class RegionList:
         new_type : None | str | Orientation
             If string, must be one of "{'vertical', 'horizontal'}
         """
+        self._data_cache = None
         if new_type is not None:
             cur_shape = self.regions[index]
             if isinstance(new_type, (str, Orientation)):
@@ -417,6 +539,26 @@ class RegionList:
         if update:
             self._update_displayed()
 
+    def update_colors(self, indices, color, update=True):
+        """Updates the face color of multiple regions at once.
+
+        Parameters
+        ----------
+        indices : iterable of int
+            Locations in list of the regions to be changed.
+        color : (4,) or (N, 4) np.ndarray
+            Single RGBA color applied to all regions or one RGBA color for each region.
+        update : bool
+            If True, update the mesh with the new color property. Set to False to avoid
+            repeated updates when modifying multiple shapes. Default is True.
+        """
+        indices = np.fromiter(indices, dtype=int)
+        self._color[indices] = color
+        mask = np.isin(self._mesh.triangles_index[:, 0], indices) & (self._mesh.triangles_index[:, 1] == 0)
+        self._mesh.triangles_colors[mask] = self._color[self._mesh.triangles_index[mask, 0]]
+        if update:
+            self._update_displayed()
+
     def update_dims_order(self, dims_order):
         """Updates dimensions order for all shapes.
 
@@ -448,6 +590,22 @@ class RegionList:
         self._z_index[index] = z_index
         self._update_z_order()
 
+    def update_z_indices(self, z_indices):
+        """Updates the z order of all regions at once.
+
+        Parameters
+        ----------
+        z_indices : (N,) array-like of int
+            Specifier of z order priority for each region.
+        """
+        z_indices = np.asarray(z_indices, dtype=int)
+        if z_indices.shape != (len(self.regions),):
+            raise ValueError(f"z_indices must have shape ({len(self.regions)},)")
+        for region, z_index in zip(self.regions, z_indices.tolist()):
+            region.z_index = z_index
+        self._z_index = z_indices
+        self._update_z_order()
+
     def highlight(self, indices):
         """Find highlights of regions listed in indices"""
         if type(indices) is list:
@@ -664,7 +822,7 @@ class RegionList:
         if colors_shape is None:
             colors_shape = self.displayed_vertices.max(axis=0).astype(np.int)
 
-        colors = np.zeros(tuple(colors_shape) + (4,), dtype=float)
+        colors = np.zeros(tuple(colors_shape) + (4,), dtype=np.float32)
         colors[..., 3] = 1
 
         z_order = self._z_order[::-1]
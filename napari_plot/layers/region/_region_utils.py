@@ -52,6 +52,21 @@ def preprocess_region(data, orientation) -> ty.List:
     return [[start, min_val], [start, max_val], [end, max_val], [end, min_val]]
 
 
+def preprocess_regions(data, orientation) -> np.ndarray:
+    """Pre-process multiple regions with the same orientation to (N, 4, 2) array of vertices."""
+    min_val, max_val = np.iinfo(np.int64).min, np.iinfo(np.int64).max
+    data = np.asarray(data, dtype=float).reshape(-1, 2)
+    start, end = data[:, 0], data[:, 1]
+    vertices = np.empty((len(data), 4, 2))
+    if orientation == "vertical":
+        vertices[:, :, 0] = [min_val, min_val, max_val, max_val]
+        vertices[:, :, 1] = np.stack([start, end, end, start], axis=1)
+    else:
+        vertices[:, :, 0] = np.stack([start, start, end, end], axis=1)
+        vertices[:, :, 1] = [min_val, max_val, max_val, min_val]
+    return vertices
+
+
 def preprocess_box(data):
     """Pre-process data to take correct values."""
     return [[data[2], data[0]], [data[3], data[1]]]
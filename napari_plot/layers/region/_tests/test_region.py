@@ -158,6 +158,12 @@ def test_thumbnail():
     assert layer.thumbnail.shape == layer._thumbnail_shape
 
 
+def test_thumbnail_empty():
+    layer = Region(None)
+    layer._update_thumbnail()
+    assert layer.thumbnail.shape == layer._thumbnail_shape
+
+
 def test_region_trim():
     data = np.random.random((20, 2))
     layer = Region(data)
@@ -167,6 +173,37 @@ def test_region_trim():
     assert layer.n_regions == 10
 
 
+def test_region_data_keeps_color():
+    data = np.random.random((5, 2))
+    layer = Region(data, color="red")
+    layer.current_color = "blue"
+    layer.data = np.random.random((7, 2))
+    assert layer.color.shape == (7, 4)
+    np.testing.assert_array_equal(layer.color[:5], [[1.0, 0.0, 0.0, 1.0]] * 5)
+    np.testing.assert_array_equal(layer.color[5:], [[0.0, 0.0, 1.0, 1.0]] * 2)
+
+    layer.data = np.random.random((3, 2))
+    assert layer.color.shape == (3, 4)
+    np.testing.assert_array_equal(layer.color, [[1.0, 0.0, 0.0, 1.0]] * 3)
+
+
+def test_region_color_dtype():
+    layer = Region(np.random.random((5, 2)), color="red")
+    assert layer.color.dtype == np.float32
+    colors = layer._coerce_colors(layer.color, layer.n_regions)
+    assert colors is layer.color
+
+
+@pytest.mark.parametrize("data", [None, [[25, 50], [50, 100]]])
+def test_region_current_color_dtype(data):
+    layer = Region(data, color="red")
+    assert layer.current_color.shape == (4,)
+    assert layer.current_color.dtype == np.float32
+    layer.current_color = "blue"
+    assert layer.current_color.shape == (4,)
+    assert layer.current_color.dtype == np.float32
+
+
 def test_z_index():
     """Test setting z-index during instantiation."""
     shape = (10, 2)
@@ -39,3 +39,91 @@ def test_bad_color_array():
     bad_color_array = np.array([[0, 0, 0, 1], [1, 1, 1, 1]])
     with pytest.raises(ValueError):
         setattr(region_list, "color", bad_color_array)
+
+
+def test_update_z_indices():
+    np.random.seed(0)
+    region_list = RegionList()
+    for _ in range(3):
+        region_list.add(Vertical(np.random.random((2,))), z_refresh=False)
+    region_list.update_z_indices([2, 0, 1])
+    assert region_list.z_indices == [2, 0, 1]
+    np.testing.assert_array_equal(region_list._z_order, [1, 2, 0])
+
+    assert region_list.next_z_index == 3
+    with pytest.raises(ValueError):
+        region_list.update_z_indices([1, 2])
+    assert RegionList().next_z_index == 0
+
+
+def test_extend_matches_add():
+    np.random.seed(0)
+    regions = [Vertical(np.random.random((2,))), Horizontal(np.random.random((2,))), Vertical(np.random.random((2,)))]
+    colors = np.random.random((3, 4)).astype(np.float32)
+
+    region_list = RegionList()
+    for region, color in zip(regions, colors):
+        region_list.add(region, color=color)
+    extended_list = RegionList()
+    extended_list.extend(regions, color=colors)
+
+    assert extended_list.orientations == region_list.orientations
+    np.testing.assert_array_equal(extended_list.color, region_list.color)
+    np.testing.assert_array_equal(extended_list._vertices, region_list._vertices)
+    np.testing.assert_array_equal(extended_list._index, region_list._index)
+    np.testing.assert_array_equal(extended_list._mesh.triangles, region_list._mesh.triangles)
+    np.testing.assert_array_equal(extended_list._mesh.triangles_index, region_list._mesh.triangles_index)
+    np.testing.assert_array_equal(extended_list._mesh.triangles_colors, region_list._mesh.triangles_colors)
+    np.testing.assert_array_equal(extended_list._mesh.triangles_z_order, region_list._mesh.triangles_z_order)
+
+
+def test_remove_many_matches_remove():
+    np.random.seed(0)
+    regions = [Vertical(np.random.random((2,))) for _ in range(3)] + [Horizontal(np.random.random((2,)))]
+    colors = np.random.random((4, 4)).astype(np.float32)
+
+    region_list = RegionList()
+    region_list.extend(regions, color=colors)
+    for index in [2, 0]:
+        region_list.remove(index)
+    region_list._color = region_list._color[[1, 3]]
+    removed_list = RegionList()
+    removed_list.extend(regions, color=colors)
+    removed_list.remove_many({0, 2})
+
+    assert removed_list.regions == [regions[1], regions[3]]
+    np.testing.assert_array_equal(removed_list.color, colors[[1, 3]])
+    np.testing.assert_array_equal(removed_list._vertices, region_list._vertices)
+    np.testing.assert_array_equal(removed_list._index, region_list._index)
+    np.testing.assert_array_equal(removed_list._mesh.vertices, region_list._mesh.vertices)
+    np.testing.assert_array_equal(removed_list._mesh.vertices_index, region_list._mesh.vertices_index)
+    np.testing.assert_array_equal(removed_list._mesh.triangles, region_list._mesh.triangles)
+    np.testing.assert_array_equal(removed_list._mesh.triangles_index, region_list._mesh.triangles_index)
+    np.testing.assert_array_equal(removed_list._mesh.triangles_colors, region_list._mesh.triangles_colors)
+
+
+def test_update_colors():
+    np.random.seed(0)
+    region_list = RegionList()
+    region_list.extend([Vertical(np.random.random((2,))) for _ in range(3)])
+    red = np.array([1, 0, 0, 1], dtype=np.float32)
+    region_list.update_colors({0, 2}, red)
+    np.testing.assert_array_equal(region_list.color, [red, [1, 1, 1, 1], red])
+    for index in range(3):
+        triangles = region_list._mesh.triangles_index[:, 0] == index
+        np.testing.assert_array_equal(region_list._mesh.triangles_colors[triangles], [region_list.color[index]] * 2)
+
+
+def test_data_cache():
+    np.random.seed(0)
+    region_list = RegionList()
+    region_list.extend([Vertical(np.random.random((2,))) for _ in range(3)])
+    assert len(region_list.data) == 3
+    region_list.add(Horizontal(np.random.random((2,))))
+    assert len(region_list.data) == 4
+    region_list.remove_many([0])
+    assert len(region_list.data) == 3
+    region_list.edit(0, [[0, 1], [0, 2], [1, 2], [1, 1]])
+    np.testing.assert_array_equal(region_list.data[0], region_list.regions[0].data)
+    region_list.remove(0)
+    assert len(region_list.data) == 2
@@ -1,4 +1,7 @@
-from napari_plot.layers.region._region_utils import preprocess_box
+import numpy as np
+import pytest
+
+from napari_plot.layers.region._region_utils import preprocess_box, preprocess_region, preprocess_regions
 
 
 def test_preprocess_box():
@@ -11,3 +14,12 @@ def test_preprocess_box():
     assert box[0][1] == data[0]
     assert box[1][0] == data[3]
     assert box[1][1] == data[1]
+
+
+@pytest.mark.parametrize("orientation", ["vertical", "horizontal"])
+def test_preprocess_regions(orientation):
+    data = [(0, 100), (50.5, 250)]
+    vertices = preprocess_regions(data, orientation)
+    assert vertices.shape == (2, 4, 2)
+    for i, d in enumerate(data):
+        np.testing.assert_array_equal(vertices[i], np.asarray(preprocess_region(d, orientation), dtype=float))
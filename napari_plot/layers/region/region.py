@@ -22,7 +22,11 @@ from napari_plot.layers.region._region import region_classes
 from napari_plot.layers.region._region_constants import Box, Mode, Orientation
 from napari_plot.layers.region._region_list import RegionList
 from napari_plot.layers.region._region_mouse_bindings import add, edit, highlight, move, select
-from napari_plot.layers.region._region_utils import get_default_region_type, parse_region_data, preprocess_region
+from napari_plot.layers.region._region_utils import get_default_region_type, parse_region_data, preprocess_regions
+
+# Regions are infinite so they do not contribute to the extent of the data.
+EMPTY_EXTENT = np.full((2, 2), np.nan)
+EMPTY_EXTENT.flags.writeable = False
 
 REV_TOOL_HELP = {
     "Hold <space> to pan/zoom, select region by clicking on it and then move mouse left-right or up-down": {Mode.MOVE},
@@ -158,7 +162,7 @@ class Region(BaseLayer):
         self._ndisplay_stored = self._ndisplay
 
         self._data_view = RegionList(ndisplay=self._ndisplay)
-        self._data_view.slice_key = np.array(self._slice_indices)[list(self._dims_not_displayed)]
+        self._data_view.slice_key = [self._slice_indices[i] for i in self._dims_not_displayed]
 
         # indices of selected regions
         self._value = (None, None)
@@ -189,16 +193,17 @@ class Region(BaseLayer):
             z_index=z_index,
         )
 
-        # set the current_* properties
+        # set the current_* properties as a (4,) float32 array so it can be broadcast without further checks
         if len(data) > 0:
-            self._current_color = self.color[-1]
-        elif len(data) == 0:
-            self._current_color = transform_color_with_defaults(
+            current_color = self.color[-1]
+        else:
+            current_color = transform_color_with_defaults(
                 num_entries=1,
                 colors=color,
                 elem_name="color",
                 default="black",
             )
+        self._current_color = np.array(current_color, dtype=np.float32).reshape(4)
         self.visible = visible
 
     # noinspection PyMethodMayBeStatic
@@ -218,17 +223,28 @@ class Region(BaseLayer):
             The calculated values for setting color
         """
         if n_regions > 0:
-            transformed_color = transform_color_with_defaults(
-                num_entries=n_regions,
-                colors=color,
-                elem_name="color",
-                default="white",
-            )
-            init_colors = normalize_and_broadcast_colors(n_regions, transformed_color)
+            init_colors = self._coerce_colors(color, n_regions)
         else:
-            init_colors = np.empty((0, 4))
+            init_colors = np.empty((0, 4), dtype=np.float32)
         return init_colors
 
+    # noinspection PyMethodMayBeStatic
+    def _coerce_colors(self, color, n_regions: int) -> np.ndarray:
+        """Transform colors to (N, 4) RGBA array.
+
+        Arrays that are already (N, 4) float32 (e.g. colors taken from the current layer state) are returned as they
+        are, without going through the color transformations again.
+        """
+        if isinstance(color, np.ndarray) and color.shape == (n_regions, 4) and color.dtype == np.float32:
+            return color
+        transformed_color = transform_color_with_defaults(
+            num_entries=n_regions,
+            colors=color,
+            elem_name="color",
+            default="white",
+        )
+        return normalize_and_broadcast_colors(n_regions, transformed_color)
+
     @property
     def color(self):
         """(N x 4) np.ndarray: Array of RGBA colors for each region."""
@@ -243,16 +259,11 @@ class Region(BaseLayer):
         color : (N, 4) array or str
             The value for setting color
         """
-        if len(self.data) > 0:
-            transformed_color = transform_color_with_defaults(
-                num_entries=len(self.data),
-                colors=color,
-                elem_name="color",
-                default="white",
-            )
-            colors = normalize_and_broadcast_colors(len(self.data), transformed_color)
+        n_regions = self.n_regions
+        if n_regions > 0:
+            colors = self._coerce_colors(color, n_regions)
         else:
-            colors = np.empty((0, 4))
+            colors = np.empty((0, 4), dtype=np.float32)
 
         self._data_view.color = colors
         self.events.color()
@@ -265,10 +276,10 @@ class Region(BaseLayer):
 
     @current_color.setter
     def current_color(self, color: ColorType):
-        self._current_color = transform_color(color)[0]
+        self._current_color = np.ascontiguousarray(transform_color(color)[0], dtype=np.float32)
         if self._update_properties:
-            for i in self.selected_data:
-                self._data_view.update_color(i, self._current_color)
+            if self.selected_data:
+                self._data_view.update_colors(self.selected_data, self._current_color)
                 self.events.color()
             self._update_thumbnail()
         self.events.current_color()
@@ -292,12 +303,10 @@ class Region(BaseLayer):
         if isinstance(z_index, list):
             if not len(z_index) == self.n_regions:
                 raise ValueError("Length of list does not match number of orientations.")
-            z_indices = z_index
+            z_indices = np.asarray(z_index, dtype=int)
         else:
-            z_indices = [z_index for _ in range(self.n_regions)]
-
-        for i, z_idx in enumerate(z_indices):
-            self._data_view.update_z_index(i, z_idx)
+            z_indices = np.full(self.n_regions, z_index, dtype=int)
+        self._data_view.update_z_indices(z_indices)
 
     def accept(self):
         """Emit accept event"""
@@ -357,22 +366,14 @@ class Region(BaseLayer):
 
         # Update properties based on selected shapes
         if len(selected_data) > 0:
-            selected_data_indices = list(selected_data)
-            selected_colors = self._data_view._color[selected_data_indices]
-            colors = np.unique(selected_colors, axis=0)
-            if len(colors) == 1:
-                self.current_color = colors[0]
+            selected_colors = self._data_view._color[np.fromiter(selected_data, dtype=int)]
+            if (selected_colors == selected_colors[0]).all():
+                self.current_color = selected_colors[0]
         self.events.selected()
 
     def remove_selected(self):
         """Remove any selected shapes."""
-        index = list(self.selected_data)
-        to_remove = sorted(index, reverse=True)
-        for ind in to_remove:
-            self._data_view.remove(ind)
-
-        if len(index) > 0:
-            self._data_view._color = np.delete(self._data_view._color, index, axis=0)
+        self._data_view.remove_many(self.selected_data)
         self.selected_data = set()
         self._finish_drawing()
         self.events.data(value=self.data)
@@ -401,27 +402,34 @@ class Region(BaseLayer):
     def _update_thumbnail(self):
         """Update thumbnail with current data"""
         # don't update the thumbnail if dragging a shape
-        if self._is_moving is False and self._allow_thumbnail_update is True:
-            # calculate min vals for the vertices and pad with 0.5
-            # the offset is needed to ensure that the top left corner of the shapes
-            # corresponds to the top left corner of the thumbnail
-            de = self._extent_data
-            offset = np.array([de[0, d] for d in self._dims_displayed]) + 0.5
-            # calculate range of values for the vertices and pad with 1
-            # padding ensures the entire shape can be represented in the thumbnail
-            # without getting clipped
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", "invalid value encountered in cast")
-                shape = np.ceil([de[1, d] - de[0, d] + 1 for d in self._dims_displayed]).astype(int)
-            zoom_factor = np.divide(self._thumbnail_shape[:2], shape[-2:]).min()
-
-            color_mapped = self._data_view.to_colors(
-                colors_shape=self._thumbnail_shape[:2],
-                zoom_factor=zoom_factor,
-                offset=offset[-2:],
-                max_shapes=self._max_regions_thumbnail,
-            )
-            self.thumbnail = color_mapped
+        if self._is_moving or not self._allow_thumbnail_update:
+            return
+        # nothing to rasterize so just show the empty background
+        if self.n_regions == 0:
+            thumbnail = np.zeros(self._thumbnail_shape, dtype=np.float32)
+            thumbnail[..., 3] = 1
+            self.thumbnail = thumbnail
+            return
+        # calculate min vals for the vertices and pad with 0.5
+        # the offset is needed to ensure that the top left corner of the shapes
+        # corresponds to the top left corner of the thumbnail
+        de = self._extent_data
+        offset = np.array([de[0, d] for d in self._dims_displayed]) + 0.5
+        # calculate range of values for the vertices and pad with 1
+        # padding ensures the entire shape can be represented in the thumbnail
+        # without getting clipped
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", "invalid value encountered in cast")
+            shape = np.ceil([de[1, d] - de[0, d] + 1 for d in self._dims_displayed]).astype(int)
+        zoom_factor = np.divide(self._thumbnail_shape[:2], shape[-2:]).min()
+
+        color_mapped = self._data_view.to_colors(
+            colors_shape=self._thumbnail_shape[:2],
+            zoom_factor=zoom_factor,
+            offset=offset[-2:],
+            max_shapes=self._max_regions_thumbnail,
+        )
+        self.thumbnail = color_mapped
 
     @property
     def _view_data(self) -> np.ndarray:
@@ -437,7 +445,7 @@ class Region(BaseLayer):
     @property
     def n_regions(self) -> int:
         """Get number of regions."""
-        return len(self._data_view.regions)
+        return self._data_view.n_regions
 
     @property
     def data(self):
@@ -448,23 +456,27 @@ class Region(BaseLayer):
     def data(self, data):
         data, orientation = parse_region_data(data)
         n_new_regions = len(data)
+        n_regions = self.n_regions
         if orientation is None:
             orientation = self.orientation
 
-        colors = self._data_view.color
         z_indices = self._data_view.z_indices
 
         # fewer shapes, trim attributes
-        if self.n_regions > n_new_regions:
+        if n_regions > n_new_regions:
             orientation = orientation[:n_new_regions]
             z_indices = z_indices[:n_new_regions]
-            colors = colors[:n_new_regions]
         # more shapes, add attributes
-        elif self.n_regions < n_new_regions:
-            n_shapes_difference = n_new_regions - self.n_regions
+        elif n_regions < n_new_regions:
+            n_shapes_difference = n_new_regions - n_regions
             orientation = orientation + [get_default_region_type(orientation)] * n_shapes_difference
             z_indices = z_indices + [0] * n_shapes_difference
-            colors = np.concatenate((colors, self._get_new_region_color(n_shapes_difference)))
+
+        # retain existing colors and fill any new regions with the current color in a single buffer
+        n_keep = min(n_regions, n_new_regions)
+        colors = np.empty((n_new_regions, 4), dtype=self._data_view.color.dtype)
+        colors[:n_keep] = self._data_view.color[:n_keep]
+        colors[n_keep:] = self._current_color
 
         self._data_view = RegionList()
         self.add(data, orientation=orientation, color=colors, z_index=z_indices)
@@ -522,21 +534,24 @@ class Region(BaseLayer):
         data, shape_type = parse_region_data(data, orientation)
 
         n_new_shapes = len(data)
+        # nothing to add so don't compute defaults or trigger redraw
+        if n_new_shapes == 0:
+            return
+
         if color is None:
             color = self._get_new_region_color(n_new_shapes)
         if self._data_view is not None:
-            z_index = z_index or max(self._data_view._z_index, default=-1) + 1
+            z_index = z_index or self._data_view.next_z_index
         else:
             z_index = z_index or 0
 
-        if n_new_shapes > 0:
-            self._add_regions(
-                data,
-                orientation=orientation,
-                color=color,
-                z_index=z_index,
-            )
-            self.events.data(value=self.data)
+        self._add_regions(
+            data,
+            orientation=orientation,
+            color=color,
+            z_index=z_index,
+        )
+        self.events.data(value=self.data)
 
     def _add_regions(
         self,
@@ -581,22 +596,17 @@ class Region(BaseLayer):
             When adding a batch of shapes, set to false  and then call
             ShapesList._update_z_order() once at the end.
         """
-        if color is None:
-            color = self._current_color
-        if self._data_view is not None:
-            z_index = z_index or max(self._data_view._z_index, default=-1) + 1
-        else:
-            z_index = z_index or 0
+        n_regions = len(data)
+        if n_regions > 0:
+            if color is None:
+                color = self._current_color
+            if self._data_view is not None:
+                z_index = z_index or self._data_view.next_z_index
+            else:
+                z_index = z_index or 0
 
-        if len(data) > 0:
             # transform the colors
-            transformed_fc = transform_color_with_defaults(
-                num_entries=len(data),
-                colors=color,
-                elem_name="color",
-                default="white",
-            )
-            transformed_color = normalize_and_broadcast_colors(len(data), transformed_fc)
+            transformed_color = self._coerce_colors(color, n_regions)
 
             # Turn input arguments into iterables
             region_inputs = zip(
@@ -607,8 +617,8 @@ class Region(BaseLayer):
             )
             self._add_regions_to_view(region_inputs, self._data_view)
 
-        self._display_order_stored = copy(self._dims_order)
-        self._ndisplay_stored = copy(self._ndisplay)
+        self._display_order_stored = list(self._dims_order)
+        self._ndisplay_stored = self._ndisplay
         self._update_dims()
 
     def _get_new_region_color(self, adding: int):
@@ -623,10 +633,9 @@ class Region(BaseLayer):
         Returns
         -------
         new_colors : (N, 4) array
-            (Nx4) RGBA array of colors for the N new shapes
+            (Nx4) RGBA array of colors for the N new shapes. This is a read-only view of the current color.
         """
-        new_colors = np.tile(self._current_color, (adding, 1))
-        return new_colors
+        return np.broadcast_to(self._current_color, (adding, 4))
 
     def _init_regions(self, data, *, orientation=None, color=None, z_index=None):
         """Add regions to the data view."""
@@ -644,14 +653,24 @@ class Region(BaseLayer):
 
     def _add_regions_to_view(self, shape_inputs, data_view):
         """Build new region and add them to the _data_view"""
-        for d, ot, fc, z in shape_inputs:
-            region_cls = region_classes[Orientation(ot)]
-            d = preprocess_region(d, ot)
-            region = region_cls(d, z_index=z, dims_order=self._dims_order, ndisplay=self._ndisplay)
-
-            # Add region
-            data_view.add(region, color=fc, z_refresh=False)
-        data_view._update_z_order()
+        shape_inputs = list(shape_inputs)
+        # coerce each distinct orientation only once
+        coerced = {ot: Orientation(ot) for ot in {ot for _, ot, _, _ in shape_inputs}}
+        orientations = [coerced[ot] for _, ot, _, _ in shape_inputs]
+        # compute vertices of all regions with one call per orientation
+        vertices = np.empty((len(shape_inputs), 4, 2))
+        for ot in set(orientations):
+            indices = [i for i, o in enumerate(orientations) if o == ot]
+            vertices[indices] = preprocess_regions([shape_inputs[i][0] for i in indices], ot)
+
+        regions, colors = [], []
+        dims_order, ndisplay = self._dims_order, self._ndisplay
+        for d, ot, (_, _, fc, z) in zip(vertices, orientations, shape_inputs):
+            regions.append(region_classes[ot](d, z_index=z, dims_order=dims_order, ndisplay=ndisplay))
+            colors.append(fc)
+
+        # Add regions
+        data_view.extend(regions, color=np.reshape(colors, (-1, 4)))
 
     @property
     def orientation(self):
@@ -675,7 +694,7 @@ class Region(BaseLayer):
 
     @property
     def _extent_data(self) -> np.ndarray:
-        return np.full((2, 2), np.nan)
+        return EMPTY_EXTENT
 
     def _set_highlight(self, force=False):
         """Render highlights.
@@ -685,18 +704,22 @@ class Region(BaseLayer):
         force : bool
             Bool that forces a redraw to occur when `True`.
         """
-        # Check if any shape or vertex ids have changed since last call
-        if (
-            self.selected_data == self._selected_data_stored
-            and np.all(self._value == self._value_stored)
-            and np.all(self._drag_box == self._drag_box_stored)
-        ) and not force:
-            return
-        self._selected_data_stored = copy(self.selected_data)
-        self._value_stored = copy(self._value)
-        self._drag_box_stored = copy(self._drag_box)
+        # Check if any shape or vertex ids have changed since last call, starting with the cheapest comparisons
+        if not force and self._value == self._value_stored and self._is_drag_box_stored():
+            if self.selected_data == self._selected_data_stored:
+                return
+        # value is an immutable tuple so it can be stored without copying
+        self._selected_data_stored = frozenset(self.selected_data)
+        self._value_stored = self._value
+        self._drag_box_stored = None if self._drag_box is None else self._drag_box.copy()
         self.events.highlight()
 
+    def _is_drag_box_stored(self) -> bool:
+        """Check whether drag box is the same as the one used in the last highlight."""
+        if self._drag_box is None or self._drag_box_stored is None:
+            return self._drag_box is self._drag_box_stored
+        return np.array_equal(self._drag_box, self._drag_box_stored)
+
     def _compute_vertices_and_box(self):
         """Compute location of highlight vertices and box for rendering.
 
@@ -737,18 +760,18 @@ class Region(BaseLayer):
         """Moves selected objects to be displayed in front of all others."""
         if len(self.selected_data) == 0:
             return
-        new_z_index = max(self._data_view._z_index) + 1
-        for index in self.selected_data:
-            self._data_view.update_z_index(index, new_z_index)
+        z_indices = self._data_view._z_index.copy()
+        z_indices[list(self.selected_data)] = z_indices.max() + 1
+        self._data_view.update_z_indices(z_indices)
         self.refresh()
 
     def move_to_back(self):
         """Moves selected objects to be displayed behind all others."""
         if len(self.selected_data) == 0:
             return
-        new_z_index = min(self._data_view._z_index) - 1
-        for index in self.selected_data:
-            self._data_view.update_z_index(index, new_z_index)
+        z_indices = self._data_view._z_index.copy()
+        z_indices[list(self.selected_data)] = z_indices.min() - 1
+        self._data_view.update_z_indices(z_indices)
         self.refresh()
 
     def interaction_box(self, index):
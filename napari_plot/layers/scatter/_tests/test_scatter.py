@@ -259,3 +259,10 @@ def test_point_selection_by_path():
 
     mask = layer._get_mask_from_path(vertices)
     assert np.sum(mask) == 20
+
+
+def test_scatter_xy():
+    x, y = np.arange(10), np.random.random(10)
+    layer = Scatter(x=x, y=y)
+    np.testing.assert_array_equal(layer.x, x)
+    np.testing.assert_array_equal(layer.y, y)
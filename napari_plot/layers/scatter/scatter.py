@@ -6,6 +6,7 @@ from napari.layers.points._points_utils import fix_data_points
 from napari.utils.events import Event
 
 from napari_plot.layers.base import LayerMixin
+from napari_plot.utils.utilities import get_data_from_xy
 
 
 class Scatter(Points, LayerMixin):
@@ -15,6 +16,10 @@ class Scatter(Points, LayerMixin):
     ----------
     data : array (N, 2)
         Coordinates for N points in 2 dimensions. Data is expected as [y, x]
+    x : array (N,), optional
+        The x-axis values. Can be specified together with `y` instead of `data`.
+    y : array (N,), optional
+        The y-axis values. Can be specified together with `x` instead of `data`.
     features : dict[str, array-like] or DataFrame
         Features table where each row corresponds to a point and each column
         is a feature.
@@ -121,6 +126,8 @@ class Scatter(Points, LayerMixin):
         self,
         data=None,
         *,
+        x=None,
+        y=None,
         features=None,
         properties=None,
         text=None,
@@ -155,7 +162,7 @@ class Scatter(Points, LayerMixin):
         scaling=True,
         label="",
     ):
-        data, ndim = fix_data_points(data, 2)
+        data, ndim = fix_data_points(get_data_from_xy(data, x, y, yx=True), 2)
         if ndim > 2:
             raise ValueError("Scatter layer only supports 2D data.")
         Points.__init__(
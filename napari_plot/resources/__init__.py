@@ -1,14 +1,44 @@
 """Get all paths."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from napari._qt.qt_resources import STYLES, get_stylesheet  # noqa
+from napari.utils.theme import _themes
 
 ICON_PATH = (Path(__file__).parent / "icons").resolve()
 ICONS = {x.stem: str(x) for x in ICON_PATH.iterdir() if x.suffix == ".svg"}
 
 STYLE_PATH = (Path(__file__).parent / "qss").resolve()
-STYLES.update({x.stem: str(x) for x in STYLE_PATH.iterdir() if x.suffix == ".qss"})
+
+
+def register_styles(path: Path):
+    """Add all `.qss` files in `path` to the list of styles."""
+    STYLES.update({x.stem: str(x) for x in path.iterdir() if x.suffix == ".qss"})
+    _get_stylesheet.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _get_stylesheet(theme_id: str) -> str:
+    """Render stylesheet."""
+    # edits to the theme palette require the stylesheet to be rendered again
+    _themes[theme_id].events.connect(clear_stylesheet_cache)
+    return get_stylesheet(theme_id)
+
+
+def clear_stylesheet_cache(event=None):
+    """Clear cached stylesheets."""
+    _get_stylesheet.cache_clear()
+
+
+def get_cached_stylesheet(theme_id: str) -> str:
+    """Return stylesheet for `theme_id`, only rendering it again if a theme or style was changed or registered."""
+    return _get_stylesheet(theme_id)
+
+
+register_styles(STYLE_PATH)
+_themes.events.added.connect(clear_stylesheet_cache)
+_themes.events.changed.connect(clear_stylesheet_cache)
 
 
 QTA_MAPPING = {
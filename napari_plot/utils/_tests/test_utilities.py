@@ -1,9 +1,10 @@
 """Test utilities."""
 
 import numpy as np
+import pytest
 from napari.utils.events import EventedList
 
-from napari_plot.utils.utilities import connect, find_nearest_index, get_min_max
+from napari_plot.utils.utilities import connect, find_nearest_index, get_data_from_xy, get_min_max, make_xy_data
 
 
 def test_find_nearest_index():
@@ -39,3 +40,31 @@ def test_connect():
     connect(obj.events.inserting, func, state=False)
     obj.insert(0, "TEST")
     assert count == 1
+
+
+def test_make_xy_data():
+    """Test combining x/y arrays."""
+    x, y = np.arange(10), np.arange(10) + 0.5
+    data = make_xy_data(x, y)
+    np.testing.assert_array_equal(data, np.c_[x, y])
+    assert data.dtype == np.float64
+    assert make_xy_data(x, y, dtype=np.float32).dtype == np.float32
+
+    with pytest.raises(ValueError):
+        make_xy_data(x, y[:5])
+    with pytest.raises(ValueError):
+        make_xy_data(np.c_[x, y], y)
+
+
+def test_get_data_from_xy():
+    """Test resolving data from x/y arrays."""
+    x, y = np.arange(10), np.arange(10) + 0.5
+    data = np.c_[x, y]
+    assert get_data_from_xy(data, None, None) is data
+    np.testing.assert_array_equal(get_data_from_xy(None, x, y), data)
+    np.testing.assert_array_equal(get_data_from_xy(None, x, y, yx=True), data[:, ::-1])
+
+    with pytest.raises(ValueError):
+        get_data_from_xy(data, x, y)
+    with pytest.raises(ValueError):
+        get_data_from_xy(None, x, None)
@@ -27,6 +27,60 @@ def find_nearest_index(data: np.ndarray, value: ty.Union[int, float, np.ndarray,
     return np.argmin(np.abs(data - value))
 
 
+def make_xy_data(x: np.ndarray, y: np.ndarray, dtype=None) -> np.ndarray:
+    """Combine x- and y-axis arrays into single (N, 2) array.
+
+    The output array is allocated once and filled column-by-column which avoids the intermediate arrays created by
+    e.g. `np.c_[x, y]`.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Array of values used as the first column.
+    y : np.ndarray
+        Array of values used as the second column.
+    dtype : np.dtype, optional
+        Data type of the output array. If not specified, it is determined from the input arrays.
+
+    Returns
+    -------
+    data : np.ndarray
+        Array of shape (N, 2).
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    if x.ndim != 1 or y.ndim != 1:
+        raise ValueError("The `x` and `y` arrays must be 1D.")
+    if x.shape != y.shape:
+        raise ValueError("The `x` and `y` arrays must have the same shape.")
+    data = np.empty((x.shape[0], 2), dtype=np.result_type(x, y) if dtype is None else dtype)
+    data[:, 0] = x
+    data[:, 1] = y
+    return data
+
+
+def get_data_from_xy(data, x, y, yx: bool = False):
+    """Return `data` or combine `x` and `y` arrays into (N, 2) array if they were specified instead.
+
+    Parameters
+    ----------
+    data : array-like, optional
+        Data array.
+    x : array-like, optional
+        The x-axis values.
+    y : array-like, optional
+        The y-axis values.
+    yx : bool
+        If True, the y-axis values are placed in the first column.
+    """
+    if x is None and y is None:
+        return data
+    if data is not None:
+        raise ValueError("Cannot specify `data` together with the `x` and `y` arrays.")
+    if x is None or y is None:
+        raise ValueError("Both `x` and `y` arrays must be specified.")
+    return make_xy_data(y, x) if yx else make_xy_data(x, y)
+
+
 def get_min_max(values):
     """Get the minimum and maximum value of an array"""
     return [np.min(values), np.max(values)]
@@ -69,6 +69,23 @@ class Viewer(ViewerModel):
         """
         return self.window.screenshot(path=path, flash=flash, canvas_only=canvas_only)
 
+    def screenshot_batch(self, paths: ty.Iterable[str], *, canvas_only=True):
+        """Save screenshot of the currently displayed screen to each of the paths.
+
+        The flash animation is not shown. For a single image, `screenshot(path, flash=False)` is equivalent.
+
+        Parameters
+        ----------
+        paths : list of str
+            Filenames for saving screenshot images.
+        canvas_only : bool
+            If True, screenshot shows only the image display canvas, and
+            if False include the napari viewer frame in the screenshot,
+            By default, True.
+        """
+        for path in paths:
+            self.window.screenshot(path=path, flash=False, canvas_only=canvas_only)
+
     def show(self, *, block=False):
         """Resize, show, and raise the viewer window."""
         self.window.show(block=block)